@@ -1,3 +1,51 @@
-"""Pysigdig"""
+"""Pysigdig
+
+Only Number is imported with the package. Everything else is imported from
+its submodule on first access, so numpy is only loaded once an array feature
+is used."""
+
+import importlib
 
 from .pysigdig import Number
+
+
+_LAZY = {
+    'compile': 'compiler',
+    'Formula': 'compiler',
+    'Accumulator': 'accumulators',
+    'CountAccumulator': 'accumulators',
+    'MaxAccumulator': 'accumulators',
+    'MeanAccumulator': 'accumulators',
+    'MinAccumulator': 'accumulators',
+    'SumAccumulator': 'accumulators',
+    'VarianceAccumulator': 'accumulators',
+    'KeyedAggregator': 'groupby',
+    'ROUNDING_MODES': 'rounding',
+    'round_sigfigs': 'rounding',
+    'round_to_lsd': 'rounding',
+    'NumberArray': 'numberarray',
+    'dot': 'linalg',
+    'matmul': 'linalg',
+    'solve': 'linalg',
+    'SharedNumberArray': 'shared',
+    'NumberColumn': 'column'}
+
+_SUBMODULES = frozenset(_LAZY.values())
+
+__all__ = ['Number'] + sorted(_LAZY)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name not in _LAZY:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(
+        importlib.import_module('.' + _LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
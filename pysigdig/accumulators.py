@@ -0,0 +1,432 @@
+"""Module with mergeable online accumulators over Numbers."""
+# pylint: disable=protected-access
+
+
+from fractions import Fraction
+import abc
+from typing import Iterable, List, Optional, Union
+import math
+import struct
+
+from .pysigdig import Number
+
+
+_SPLITTER = 134217729.0  # 2 ** 27 + 1, splits a double into two halves
+_HEADER = struct.Struct('<BB')
+_VERSION = 1
+
+
+class _ExactSum:
+    """Sum of ints and floats kept without rounding error so that partial
+    sums can be merged in any order with the same result."""
+
+    def __init__(self) -> None:
+        self.integer = 0
+        self.partials = []  # type: List[float]
+        self.is_int = True
+
+    def add(self, value: Union[int, float]) -> None:
+        """Add a value to the sum."""
+        if isinstance(value, int):
+            self.integer += value
+            return
+        self.is_int = False
+        partials = self.partials
+        i = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            high = value + partial
+            low = partial - (high - value)
+            if low:
+                partials[i] = low
+                i += 1
+            value = high
+        partials[i:] = [value]
+
+    def add_square(self, value: Union[int, float]) -> None:
+        """Add the exact square of a value to the sum."""
+        if isinstance(value, int):
+            self.integer += value * value
+            return
+        product = value * value
+        scaled = _SPLITTER * value
+        high = scaled - (scaled - value)
+        low = value - high
+        self.add(product)
+        self.add(((high * high - product) + 2 * high * low) + low * low)
+
+    def merge(self, other: '_ExactSum') -> None:
+        """Add the contents of another exact sum, which may be this one."""
+        integer, partials = other.integer, list(other.partials)
+        self.integer += integer
+        for partial in partials:
+            self.add(partial)
+        self.is_int = self.is_int and other.is_int
+
+    @property
+    def value(self) -> Union[int, float]:
+        """Get the sum, rounded once if any float was added."""
+        if self.is_int:
+            return self.integer
+        terms = list(self.partials)
+        rest = self.integer
+        while rest:  # split the int into floats that add up to it exactly
+            terms.append(float(rest))
+            rest -= int(terms[-1])
+        return math.fsum(terms)
+
+    @property
+    def fraction(self) -> Fraction:
+        """Get the sum as an exact fraction."""
+        return sum(map(Fraction, self.partials), Fraction(self.integer))
+
+
+def _encode(fields: tuple) -> bytes:
+    """Pack a tuple of None, bool, int, float and _ExactSum fields."""
+    chunks = []
+    for field in fields:
+        if field is None:
+            chunks.append(b'n')
+        elif isinstance(field, bool):
+            chunks.append(b't' if field else b'f')
+        elif isinstance(field, int):
+            data = field.to_bytes(
+                (field.bit_length() + 8) // 8, 'little', signed=True)
+            chunks.append(struct.pack('<cH', b'i', len(data)) + data)
+        elif isinstance(field, float):
+            chunks.append(struct.pack('<cd', b'd', field))
+        else:
+            chunks.append(_encode((field.is_int, field.integer)))
+            chunks.append(struct.pack(
+                '<cH{}d'.format(len(field.partials)), b's',
+                len(field.partials), *field.partials))
+    return b''.join(chunks)
+
+
+def _decode(data: bytes, offset: int) -> list:
+    """Unpack the fields written by _encode."""
+    fields = []
+    while offset < len(data):
+        tag = data[offset:offset + 1]
+        offset += 1
+        if tag == b'n':
+            fields.append(None)
+        elif tag in (b't', b'f'):
+            fields.append(tag == b't')
+        elif tag == b'i':
+            size, = struct.unpack_from('<H', data, offset)
+            offset += 2
+            fields.append(int.from_bytes(
+                data[offset:offset + size], 'little', signed=True))
+            offset += size
+        elif tag == b'd':
+            fields.append(struct.unpack_from('<d', data, offset)[0])
+            offset += 8
+        elif tag == b's':
+            count, = struct.unpack_from('<H', data, offset)
+            offset += 2
+            exact = _ExactSum()
+            exact.integer = fields.pop()
+            exact.is_int = fields.pop()
+            exact.partials = list(struct.unpack_from(
+                '<{}d'.format(count), data, offset))
+            offset += 8 * count
+            fields.append(exact)
+        else:
+            raise ValueError('Corrupt accumulator data.')
+    return fields
+
+
+class Accumulator(abc.ABC):
+    """Base class of online accumulators that can be updated one Number at a
+    time, merged with partial results from other shards and serialized."""
+
+    _CODE = 0
+    _REGISTRY = {}  # type: dict
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if '_CODE' in cls.__dict__:
+            Accumulator._REGISTRY[cls._CODE] = cls
+
+    @abc.abstractmethod
+    def update(self, number: Number) -> None:
+        """Add a Number to the accumulator."""
+
+    def update_batch(self, numbers: Iterable[Number]) -> None:
+        """Add every Number of an iterable to the accumulator."""
+        update = self.update
+        for number in numbers:
+            update(number)
+
+    def merge(self, other: 'Accumulator') -> None:
+        """Combine the state of another accumulator of the same type."""
+        if type(other) is not type(self):
+            raise TypeError('Cannot merge {} into {}.'.format(
+                type(other).__name__, type(self).__name__))
+        self._merge(other)
+
+    @abc.abstractmethod
+    def result(self):
+        """Get the aggregate of all Numbers added so far."""
+
+    def to_bytes(self) -> bytes:
+        """Serialize the state of the accumulator."""
+        return _HEADER.pack(self._CODE, _VERSION) + _encode(self._state())
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Accumulator':
+        """Restore an accumulator serialized with to_bytes."""
+        code, version = _HEADER.unpack_from(data)
+        if version != _VERSION or code not in Accumulator._REGISTRY:
+            raise ValueError('Unsupported accumulator data.')
+        accumulator = Accumulator._REGISTRY[code]()
+        accumulator._restore(_decode(data, _HEADER.size))
+        return accumulator
+
+    @abc.abstractmethod
+    def _merge(self, other: 'Accumulator') -> None:
+        """Combine the state of another accumulator of this type."""
+
+    @abc.abstractmethod
+    def _state(self) -> tuple:
+        """Get the fields to serialize."""
+
+    @abc.abstractmethod
+    def _restore(self, fields: list) -> None:
+        """Set the fields read back from serialized data."""
+
+
+class CountAccumulator(Accumulator):
+    """Count the Numbers that have been added."""
+
+    _CODE = 1
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    def update(self, number: Number) -> None:
+        self._count += 1
+
+    def update_batch(self, numbers: Iterable[Number]) -> None:
+        try:
+            self._count += len(numbers)
+        except TypeError:
+            self._count += sum(1 for _ in numbers)
+
+    def _merge(self, other: 'CountAccumulator') -> None:
+        self._count += other._count
+
+    def result(self) -> int:
+        return self._count
+
+    def _state(self) -> tuple:
+        return (self._count,)
+
+    def _restore(self, fields: list) -> None:
+        self._count, = fields
+
+
+class SumAccumulator(Accumulator):
+    """Sum Numbers with the rules of Number.__add__: the least significant
+    digit is the coarsest one added and tolerances add up. The value is summed
+    exactly so that merging partial sums in any order gives the same result as
+    a single pass."""
+
+    _CODE = 2
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._value = _ExactSum()
+        self._lsd = None  # type: Optional[Union[int, float]]
+        self._tolerance = None  # type: Optional[_ExactSum]
+
+    def update(self, number: Number) -> None:
+        value, _, lsd, tolerance = number.components
+        self._count += 1
+        self._value.add(value)
+        if self._lsd is None or lsd > self._lsd:
+            self._lsd = lsd
+        if tolerance is not None:
+            if self._tolerance is None:
+                self._tolerance = _ExactSum()
+            self._tolerance.add(tolerance)
+
+    def _merge(self, other: 'SumAccumulator') -> None:
+        if other._count == 0:
+            return
+        self._count += other._count
+        self._value.merge(other._value)
+        if self._lsd is None or other._lsd > self._lsd:
+            self._lsd = other._lsd
+        if other._tolerance is not None:
+            if self._tolerance is None:
+                self._tolerance = _ExactSum()
+            self._tolerance.merge(other._tolerance)
+
+    def result(self) -> Number:
+        if self._count == 0:
+            raise ValueError('Cannot sum an empty accumulator.')
+        value = self._value.value
+        return Number.from_components(
+            value,
+            Number.get_sigdigs_from_lsd(value, self._lsd),
+            self._lsd,
+            None if self._tolerance is None else self._tolerance.value)
+
+    def _state(self) -> tuple:
+        return self._count, self._value, self._lsd, self._tolerance
+
+    def _restore(self, fields: list) -> None:
+        self._count, self._value, self._lsd, self._tolerance = fields
+
+
+class MeanAccumulator(SumAccumulator):
+    """Average Numbers as the sum divided by the count, which divides by a
+    constant and so keeps the significant digits of the sum."""
+
+    _CODE = 3
+
+    def result(self) -> Number:
+        return super().result() / self._count
+
+
+class _ExtremumAccumulator(Accumulator):
+    """Keep the Number with the extreme unrounded value, the first one wins
+    ties."""
+
+    def __init__(self) -> None:
+        self._components = None  # type: Optional[tuple]
+
+    @abc.abstractmethod
+    def _replaces(self, value: Union[int, float]) -> bool:
+        """Check whether a value is more extreme than the one kept."""
+
+    def update(self, number: Number) -> None:
+        components = number.components
+        if self._components is None or self._replaces(components[0]):
+            self._components = components
+
+    def _merge(self, other: '_ExtremumAccumulator') -> None:
+        if other._components is not None and (
+                self._components is None or
+                self._replaces(other._components[0])):
+            self._components = other._components
+
+    def result(self) -> Number:
+        if self._components is None:
+            raise ValueError('Cannot take the extremum of an empty '
+                             'accumulator.')
+        return Number.from_components(*self._components)
+
+    def _state(self) -> tuple:
+        return self._components or (None, None, None, None)
+
+    def _restore(self, fields: list) -> None:
+        self._components = None if fields[0] is None else tuple(fields)
+
+
+class MinAccumulator(_ExtremumAccumulator):
+    """Keep the Number with the smallest value."""
+
+    _CODE = 4
+
+    def _replaces(self, value: Union[int, float]) -> bool:
+        return value < self._components[0]
+
+
+class MaxAccumulator(_ExtremumAccumulator):
+    """Keep the Number with the largest value."""
+
+    _CODE = 5
+
+    def _replaces(self, value: Union[int, float]) -> bool:
+        return value > self._components[0]
+
+
+class VarianceAccumulator(Accumulator):  # pylint: disable=R0902
+    """Sample variance of Numbers. The value is computed exactly from the sum
+    and sum of squares, it keeps the fewest significant digits of any Number
+    like a product does, and the tolerance is the first order bound
+    (4 * R * T + Q + 3 * T ** 2 / n) / (n - 1), where R is the range of the
+    values, T the sum of the tolerances and Q the sum of their squares."""
+
+    _CODE = 6
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._sum = _ExactSum()
+        self._squares = _ExactSum()
+        self._sigdigs = None  # type: Optional[Union[int, float]]
+        self._min = None  # type: Optional[Union[int, float]]
+        self._max = None  # type: Optional[Union[int, float]]
+        self._tolerance = None  # type: Optional[_ExactSum]
+        self._tolerance_squares = None  # type: Optional[_ExactSum]
+
+    def update(self, number: Number) -> None:
+        value, sigdigs, _, tolerance = number.components
+        self._count += 1
+        self._sum.add(value)
+        self._squares.add_square(value)
+        if self._sigdigs is None or sigdigs < self._sigdigs:
+            self._sigdigs = sigdigs
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+        if tolerance is not None:
+            if self._tolerance is None:
+                self._tolerance = _ExactSum()
+                self._tolerance_squares = _ExactSum()
+            self._tolerance.add(tolerance)
+            self._tolerance_squares.add_square(tolerance)
+
+    def _merge(self, other: 'VarianceAccumulator') -> None:
+        if other._count == 0:
+            return
+        self._count += other._count
+        self._sum.merge(other._sum)
+        self._squares.merge(other._squares)
+        if self._sigdigs is None or other._sigdigs < self._sigdigs:
+            self._sigdigs = other._sigdigs
+        if self._min is None or other._min < self._min:
+            self._min = other._min
+        if self._max is None or other._max > self._max:
+            self._max = other._max
+        if other._tolerance is not None:
+            if self._tolerance is None:
+                self._tolerance = _ExactSum()
+                self._tolerance_squares = _ExactSum()
+            self._tolerance.merge(other._tolerance)
+            self._tolerance_squares.merge(other._tolerance_squares)
+
+    def result(self) -> Number:
+        if self._count < 2:
+            raise ValueError('Variance requires at least two Numbers.')
+        count = self._count
+        total = self._sum.fraction
+        value = float(
+            (count * self._squares.fraction - total * total) /
+            (count * (count - 1)))
+        tolerance = None
+        if self._tolerance is not None:
+            spread = self._tolerance.fraction
+            tolerance = float((
+                4 * Fraction(self._max - self._min) * spread +
+                self._tolerance_squares.fraction +
+                3 * spread * spread / count) / (count - 1))
+        return Number.from_components(
+            value,
+            self._sigdigs,
+            Number.get_lsd_from_sigdigs(value, self._sigdigs),
+            tolerance)
+
+    def _state(self) -> tuple:
+        return (
+            self._count, self._sum, self._squares, self._sigdigs, self._min,
+            self._max, self._tolerance, self._tolerance_squares)
+
+    def _restore(self, fields: list) -> None:
+        (self._count, self._sum, self._squares, self._sigdigs, self._min,
+         self._max, self._tolerance, self._tolerance_squares) = fields
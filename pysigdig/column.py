@@ -0,0 +1,390 @@
+"""Module with a column of Numbers that stores metadata shared by its values
+once, as runs of equal values, or per value only where the values diverge."""
+# pylint: disable=protected-access
+
+
+from typing import Callable, Dict, Optional, Sequence, Union
+
+from .numberarray import NumberArray, numpy, require_numpy
+from .pysigdig import Number
+from .rounding import (
+    lsd_from_sigdigs, round_to_lsd, sigdigs_from_int, sigdigs_from_lsd)
+
+
+_RUN_RATIO = 4  # store runs when there are at most a quarter as many as values
+
+
+def _same(first, second):
+    """Compare elementwise, treating NaN as equal to NaN."""
+    return (first == second) | (numpy.isnan(first) & numpy.isnan(second))
+
+
+class _Encoded:
+    """Float64 column stored as runs of equal values, the run k covering the
+    elements from ends[k - 1] up to ends[k], or as one value per element when
+    ends is None. A single run is a uniform column."""
+
+    __slots__ = ('length', 'ends', 'values')
+
+    def __init__(self, length: int, ends, values) -> None:
+        self.length = length
+        self.ends = ends
+        self.values = values
+
+    @classmethod
+    def uniform(cls, value: float, length: int) -> '_Encoded':
+        """Encode a column with the same value everywhere."""
+        return cls(
+            length, numpy.array([length], dtype=numpy.int64),
+            numpy.array([value], dtype=numpy.float64))
+
+    @classmethod
+    def encode(cls, column) -> '_Encoded':
+        """Encode a column as runs if that is compact enough, else densely."""
+        column = numpy.array(column, dtype=numpy.float64).ravel()
+        length = len(column)
+        if length == 0:
+            return cls.uniform(numpy.nan, 0)
+        ends = numpy.append(
+            numpy.flatnonzero(~_same(column[1:], column[:-1])) + 1, length)
+        if len(ends) > 1 and len(ends) * _RUN_RATIO > length:
+            return cls(length, None, column)
+        return cls(length, ends, column[ends - 1])
+
+    @classmethod
+    def runs(cls, length: int, ends, values) -> '_Encoded':
+        """Encode runs, merging neighbours that ended up with equal values."""
+        keep = numpy.append(~_same(values[1:], values[:-1]), True)
+        return cls(length, ends[keep], values[keep])
+
+    @classmethod
+    def combine(
+            cls,
+            first: '_Encoded',
+            second: '_Encoded',
+            function: Callable) -> '_Encoded':
+        """Apply an elementwise function of two columns. Runs are combined
+        run by run on the union of their boundaries."""
+        if first.ends is None or second.ends is None:
+            return cls.encode(function(first.decode(), second.decode()))
+        ends = numpy.union1d(first.ends, second.ends)
+        return cls.runs(first.length, ends, function(
+            first.values[numpy.searchsorted(first.ends, ends - 1, 'right')],
+            second.values[numpy.searchsorted(second.ends, ends - 1, 'right')]))
+
+    def map(self, function: Callable) -> '_Encoded':
+        """Apply an elementwise function of one column."""
+        if self.ends is None:
+            return self.encode(function(self.values))
+        return self.runs(self.length, self.ends, function(self.values))
+
+    def decode(self):
+        """Get one value per element."""
+        if self.ends is None:
+            return self.values
+        return numpy.repeat(self.values, numpy.diff(self.ends, prepend=0))
+
+    def slice(self, start: int, stop: int) -> '_Encoded':
+        """Get the elements from start up to stop, keeping runs as runs."""
+        if self.ends is None:
+            return self.encode(self.values[start:stop])
+        if stop <= start:
+            return self.uniform(numpy.nan, 0)
+        first = numpy.searchsorted(self.ends, start, 'right')
+        last = numpy.searchsorted(self.ends, stop - 1, 'right') + 1
+        return _Encoded(
+            stop - start,
+            numpy.minimum(self.ends[first:last], stop) - start,
+            self.values[first:last])
+
+    @property
+    def kind(self) -> str:
+        """Get "uniform", "runs" or "dense"."""
+        if self.ends is None:
+            return 'dense'
+        return 'uniform' if len(self.ends) == 1 else 'runs'
+
+    @property
+    def nbytes(self) -> int:
+        """Get the bytes held by the encoding."""
+        return self.values.nbytes + (0 if self.ends is None else
+                                     self.ends.nbytes)
+
+
+def _add_tolerances(first, second):
+    """Tolerance of a sum, NaN only where neither operand has one."""
+    return numpy.where(
+        numpy.isnan(first) & numpy.isnan(second),
+        numpy.nan,
+        numpy.where(numpy.isnan(first), 0, first) +
+        numpy.where(numpy.isnan(second), 0, second))
+
+
+class NumberColumn:
+    """One dimensional column of Numbers with compressed metadata. Values are
+    stored one per element, while significant digits, least significant digits
+    and tolerances are each stored once if they are the same for the whole
+    column, as runs if they change rarely, and per element otherwise.
+
+    Like a Number, a column keeps the least significant digits after an
+    addition and the significant digits after a multiplication, and derives
+    the other from the values only when it is asked for. Arithmetic combines
+    uniform and run encoded metadata without expanding it, so adding two
+    columns with a uniform least significant digit gives another one.
+    Integer values get the significant digits of Number(int)."""
+
+    def __init__(
+            self,
+            values: Sequence[float],
+            sigdigs=None,
+            lsd=None,
+            tolerance=None) -> None:
+        require_numpy('NumberColumn')
+        values = numpy.asarray(values)
+        self._values = numpy.array(values, dtype=numpy.float64)
+        if self._values.ndim != 1:
+            raise ValueError('Columns must have one dimension.')
+        length = len(self._values)
+        if numpy.issubdtype(values.dtype, numpy.integer):
+            self._sigdigs, self._lsd = map(
+                _Encoded.encode, sigdigs_from_int(values))
+        else:
+            self._sigdigs = _Encoded.uniform(numpy.inf, length)
+            self._lsd = _Encoded.uniform(-numpy.inf, length)
+        if sigdigs is not None:
+            self._sigdigs = self._parameter(sigdigs, length)
+            self._lsd = None
+        if lsd is not None:
+            self._lsd = self._parameter(lsd, length)
+            self._sigdigs = None
+        self._tolerance = _Encoded.uniform(numpy.nan, length)
+        if tolerance is not None:
+            self._tolerance = self._parameter(tolerance, length).map(
+                numpy.abs)
+
+    @staticmethod
+    def _parameter(parameter, length: int) -> _Encoded:
+        if numpy.ndim(parameter) == 0:
+            return _Encoded.uniform(float(parameter), length)
+        parameter = numpy.asarray(parameter, dtype=numpy.float64)
+        if parameter.shape != (length,):
+            raise ValueError('Parameter must be a scalar or match the values.')
+        return _Encoded.encode(parameter)
+
+    @classmethod
+    def _from_parts(
+            cls,
+            values,
+            sigdigs: Optional[_Encoded],
+            lsd: Optional[_Encoded],
+            tolerance: _Encoded) -> 'NumberColumn':
+        column = cls.__new__(cls)
+        column._values = values
+        column._sigdigs = sigdigs
+        column._lsd = lsd
+        column._tolerance = tolerance
+        return column
+
+    @classmethod
+    def from_array(cls, array: NumberArray) -> 'NumberColumn':
+        """Create a column from a one dimensional NumberArray, keeping only
+        the metadata that cannot be derived from the rest."""
+        require_numpy('NumberColumn')
+        if array.ndim != 1:
+            raise ValueError('Columns must have one dimension.')
+        values = numpy.array(array.values)
+        sigdigs = _Encoded.encode(array.sigdigs)
+        lsd = _Encoded.encode(array.lsd)
+        if lsd.kind != 'dense' and numpy.array_equal(
+                sigdigs_from_lsd(values, array.lsd), array.sigdigs):
+            sigdigs = None
+        elif sigdigs.kind != 'dense' and numpy.array_equal(
+                lsd_from_sigdigs(values, array.sigdigs), array.lsd):
+            lsd = None
+        return cls._from_parts(
+            values, sigdigs, lsd, _Encoded.encode(array.tolerance))
+
+    @classmethod
+    def from_numbers(cls, numbers: Sequence[Number]) -> 'NumberColumn':
+        """Create a column from a sequence of Numbers."""
+        return cls.from_array(NumberArray.from_numbers(numbers))
+
+    def to_array(self) -> NumberArray:
+        """Expand to a NumberArray."""
+        return NumberArray.from_components(
+            self._values, self.sigdigs, self.lsd, self.tolerance)
+
+    def to_numbers(self) -> list:
+        """Convert to a list of Numbers."""
+        return self.to_array().to_numbers()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index) -> Union[Number, 'NumberColumn']:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return NumberColumn.from_array(self.to_array()[index])
+            stop = max(start, stop)
+            return NumberColumn._from_parts(
+                self._values[start:stop],
+                None if self._sigdigs is None else
+                self._sigdigs.slice(start, stop),
+                None if self._lsd is None else self._lsd.slice(start, stop),
+                self._tolerance.slice(start, stop))
+        index = range(len(self))[index]
+        return self[index:index + 1].to_array()[0]
+
+    def __add__(self, other) -> 'NumberColumn':
+        return self._sum(other, numpy.add, 'add')
+
+    def __sub__(self, other) -> 'NumberColumn':
+        return self._sum(other, numpy.subtract, 'subtract')
+
+    def __mul__(self, other) -> 'NumberColumn':
+        return self._product(other, numpy.multiply, 'multiply')
+
+    def __truediv__(self, other) -> 'NumberColumn':
+        return self._product(other, numpy.true_divide, 'divide')
+
+    def _sum(self, other, operation, verb: str) -> 'NumberColumn':
+        """Follow Number.__add__: the coarsest least significant digit and
+        the sum of the tolerances."""
+        if isinstance(other, (float, int)):
+            return NumberColumn._from_parts(
+                operation(self._values, other), None, self._encoded_lsd(),
+                self._tolerance)
+        other = self._coerce(other, verb)
+        return NumberColumn._from_parts(
+            operation(self._values, other._values),
+            None,
+            _Encoded.combine(
+                self._encoded_lsd(), other._encoded_lsd(), numpy.maximum),
+            _Encoded.combine(
+                self._tolerance, other._tolerance, _add_tolerances))
+
+    def _product(self, other, operation, verb: str) -> 'NumberColumn':
+        """Follow Number.__mul__ and Number.__truediv__: the fewest
+        significant digits and a tolerance that depends on the values."""
+        if isinstance(other, (float, int)):
+            return NumberColumn._from_parts(
+                operation(self._values, other), self._encoded_sigdigs(), None,
+                self._tolerance.map(lambda t: numpy.abs(operation(t, other))))
+        other = self._coerce(other, verb)
+        values = operation(self._values, other._values)
+        sigdigs = _Encoded.combine(
+            self._encoded_sigdigs(), other._encoded_sigdigs(), numpy.minimum)
+        if self._tolerance.kind == other._tolerance.kind == 'uniform' and \
+                numpy.isnan(self._tolerance.values[0]) and \
+                numpy.isnan(other._tolerance.values[0]):
+            tolerance = self._tolerance
+        elif operation is numpy.multiply:
+            tolerance = _Encoded.encode(self._product_tolerance(other))
+        else:
+            tolerance = _Encoded.encode(
+                self._quotient_tolerance(other, values))
+        return NumberColumn._from_parts(values, sigdigs, None, tolerance)
+
+    def _product_tolerance(self, other: 'NumberColumn'):
+        first = self.tolerance
+        second = other.tolerance
+        none = numpy.isnan(first) & numpy.isnan(second)
+        first = numpy.where(numpy.isnan(first), 0, first)
+        second = numpy.where(numpy.isnan(second), 0, second)
+        return numpy.where(
+            none, numpy.nan,
+            numpy.abs(first * other._values) +
+            numpy.abs(second * self._values) + first * second)
+
+    def _quotient_tolerance(self, other: 'NumberColumn', quotient):
+        first = self.tolerance
+        second = other.tolerance
+        none = numpy.isnan(first) & numpy.isnan(second)
+        first = numpy.where(numpy.isnan(first), 0, first)
+        second = numpy.where(numpy.isnan(second), 0, second)
+        dividend = round_to_lsd(self._values, self.lsd)
+        divisor = round_to_lsd(other._values, other.lsd)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            bounds = numpy.maximum(
+                numpy.abs(numpy.abs(quotient) - numpy.abs(
+                    (dividend + first) / (divisor - second))),
+                numpy.abs(numpy.abs(quotient) - numpy.abs(
+                    (dividend - first) / (divisor + second))))
+        return numpy.where(none, numpy.nan, bounds)
+
+    def _coerce(self, other, verb: str) -> 'NumberColumn':
+        """Get another operand as a column of the same length, broadcasting
+        a Number without copying it."""
+        if isinstance(other, Number):
+            value, sigdigs, lsd, tolerance = other.components
+            length = len(self)
+            return NumberColumn._from_parts(
+                numpy.broadcast_to(numpy.float64(value), (length,)),
+                _Encoded.uniform(sigdigs, length),
+                _Encoded.uniform(lsd, length),
+                _Encoded.uniform(
+                    numpy.nan if tolerance is None else tolerance, length))
+        if not isinstance(other, NumberColumn):
+            raise TypeError('Cannot {} type {} and NumberColumn.'.format(
+                verb, type(other)))
+        if len(other) != len(self):
+            raise ValueError('Columns have lengths {} and {}.'.format(
+                len(self), len(other)))
+        return other
+
+    def _encoded_sigdigs(self) -> _Encoded:
+        if self._sigdigs is not None:
+            return self._sigdigs
+        return _Encoded.encode(self.sigdigs)
+
+    def _encoded_lsd(self) -> _Encoded:
+        if self._lsd is not None:
+            return self._lsd
+        return _Encoded.encode(self.lsd)
+
+    @property
+    def values(self):
+        """Get the unrounded values."""
+        return self._values
+
+    @property
+    def sigdigs(self):
+        """Get the significant digits of every element."""
+        if self._sigdigs is not None:
+            return self._sigdigs.decode()
+        return sigdigs_from_lsd(self._values, self._lsd.decode())
+
+    @property
+    def lsd(self):
+        """Get the least significant digits of every element."""
+        if self._lsd is not None:
+            return self._lsd.decode()
+        return lsd_from_sigdigs(self._values, self._sigdigs.decode())
+
+    @property
+    def tolerance(self):
+        """Get the tolerances of every element, NaN where there is none."""
+        return self._tolerance.decode()
+
+    @property
+    def encodings(self) -> Dict[str, str]:
+        """Get how the significant digits, least significant digits and
+        tolerances are stored: "uniform", "runs", "dense", or "derived" from
+        the values and the other digits."""
+        return {
+            'sigdigs': 'derived' if self._sigdigs is None else
+                       self._sigdigs.kind,
+            'lsd': 'derived' if self._lsd is None else self._lsd.kind,
+            'tolerance': self._tolerance.kind}
+
+    @property
+    def nbytes(self) -> int:
+        """Get the bytes held by the values and the metadata."""
+        return self._values.nbytes + sum(
+            part.nbytes for part in (self._sigdigs, self._lsd, self._tolerance)
+            if part is not None)
@@ -0,0 +1,358 @@
+"""Module to compile arithmetic formulas over Numbers into reusable kernels."""
+
+
+from itertools import repeat
+from operator import attrgetter
+from typing import List, Optional, Sequence, Tuple
+import ast
+import builtins
+import operator
+import sys
+
+from .pysigdig import Number
+
+
+_BINARY_OPERATORS = {
+    ast.Add: ('add', '+', operator.add),
+    ast.Sub: ('sub', '-', operator.sub),
+    ast.Mult: ('mul', '*', operator.mul),
+    ast.Div: ('truediv', '/', operator.truediv),
+    ast.FloorDiv: ('floordiv', '//', operator.floordiv),
+    ast.Mod: ('mod', '%', operator.mod),
+    ast.Pow: ('pow', '**', operator.pow)}
+
+_KERNEL_GLOBALS = {
+    '_isig': Number.get_sigdigs_from_int,
+    '_lsd': Number.get_lsd_from_sigdigs,
+    '_round': Number.round_to_lsd,
+    '_sig': Number.get_sigdigs_from_lsd}
+
+_COMPONENTS = attrgetter('components')
+
+
+class Formula:
+    """A formula compiled into a kernel that evaluates the whole expression
+    tree in a single call, following the same propagation rules as the
+    arithmetic operators of Number."""
+
+    def __init__(
+            self,
+            expression: str,
+            variables: Sequence[str],
+            source: str,
+            kernel) -> None:
+        self._expression = expression
+        self._variables = tuple(variables)
+        self._source = source
+        self._kernel = kernel
+
+    def __call__(self, *args, **kwargs):
+        arguments = self._bind(args, kwargs)
+        lengths = set()
+        for argument in arguments:
+            if isinstance(argument, Number):
+                continue
+            if isinstance(argument, (int, float, str)):
+                raise TypeError(
+                    'Invalid type {} provided as formula argument, expected '
+                    'Number or a column of Numbers.'.format(type(argument)))
+            lengths.add(len(argument))
+        if not lengths:
+            return Number.from_components(
+                *self._kernel(*[arg.components for arg in arguments]))
+        if len(lengths) > 1:
+            raise ValueError('All columns must have the same length.')
+        length = lengths.pop()
+        columns = [
+            repeat(argument.components, length)
+            if isinstance(argument, Number) else map(_COMPONENTS, argument)
+            for argument in arguments]
+        kernel = self._kernel
+        from_components = Number.from_components
+        return [from_components(*kernel(*row)) for row in zip(*columns)]
+
+    def _bind(self, args: tuple, kwargs: dict) -> list:
+        if len(args) > len(self._variables):
+            raise TypeError(
+                'Formula takes {} arguments but {} were given.'.format(
+                    len(self._variables), len(args)))
+        arguments = list(args)
+        for name in self._variables[len(args):]:
+            if name not in kwargs:
+                raise TypeError('Missing value for variable "{}".'.format(
+                    name))
+            arguments.append(kwargs.pop(name))
+        if kwargs:
+            raise TypeError('Unexpected variables: {}.'.format(
+                ', '.join(sorted(kwargs))))
+        return arguments
+
+    @property
+    def expression(self) -> str:
+        """Get the expression this formula was compiled from."""
+        return self._expression
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        """Get the names of the variables in the order of positional
+        arguments."""
+        return self._variables
+
+    @property
+    def source(self) -> str:
+        """Get the Python source of the generated kernel."""
+        return self._source
+
+
+class _KernelBuilder:
+    """Walk the syntax tree of a formula once and emit straight-line code that
+    computes the value, significant digits, least significant digit and
+    tolerance of every node."""
+
+    def __init__(self, variables: Sequence[str]) -> None:
+        self.variables = list(variables)
+        self.lines = []  # type: List[str]
+        self.constants = {}
+        self.count = len(self.variables)
+
+    def build(self, tree: ast.Expression) -> Tuple[str, dict]:
+        """Generate the kernel source and the globals it needs."""
+        result = self.visit(tree.body)
+        if result[0] == 'const':
+            raise ValueError('Formula does not depend on any variable.')
+        arguments = ', '.join('a{}'.format(i) for i in range(len(
+            self.variables)))
+        header = ['def _kernel({}):'.format(arguments)]
+        header += [
+            '    v{0}, s{0}, l{0}, t{0} = a{0}'.format(i)
+            for i in range(len(self.variables))]
+        footer = ['    return v{0}, s{0}, l{0}, t{0}'.format(result[1])]
+        source = '\n'.join(header + self.lines + footer) + '\n'
+        namespace = dict(_KERNEL_GLOBALS)
+        namespace.update(self.constants)
+        return source, namespace
+
+    def visit(self, node: ast.AST) -> tuple:
+        """Return ('const', value) or ('num', index) for a node."""
+        if isinstance(node, ast.Name):
+            if node.id not in self.variables:
+                raise ValueError(
+                    'Unknown variable "{}" in formula.'.format(node.id))
+            return 'num', self.variables.index(node.id)
+        if sys.version_info < (3, 8) and isinstance(node, ast.Num):
+            return self.constant(node.n)
+        if isinstance(node, ast.Constant):
+            return self.constant(node.value)
+        if isinstance(node, ast.UnaryOp):
+            return self.visit_unary(node)
+        if isinstance(node, ast.BinOp):
+            return self.visit_binary(node)
+        raise ValueError('Unsupported syntax "{}" in formula.'.format(
+            type(node).__name__))
+
+    @staticmethod
+    def constant(value) -> tuple:
+        """Accept int and float literals only."""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError('Invalid constant {!r} in formula.'.format(value))
+        return 'const', value
+
+    def visit_unary(self, node: ast.UnaryOp) -> tuple:
+        """Fold constants and emit code for negation."""
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if not isinstance(node.op, ast.USub):
+            raise ValueError('Unsupported operator "{}" in formula.'.format(
+                type(node.op).__name__))
+        if operand[0] == 'const':
+            return 'const', -operand[1]
+        a = operand[1]
+        n = self.allocate()
+        self.emit(
+            'f{a} = _round(v{a}, l{a})',
+            'v{n} = -(int(f{a}) if isinstance(v{a}, int) else f{a})',
+            's{n} = s{a}',
+            'l{n} = _lsd(v{n}, s{n})',
+            't{n} = t{a}', a=a, n=n)
+        return 'num', n
+
+    def visit_binary(self, node: ast.BinOp) -> tuple:
+        """Fold constants and emit code for a binary operator."""
+        if type(node.op) not in _BINARY_OPERATORS:
+            raise ValueError('Unsupported operator "{}" in formula.'.format(
+                type(node.op).__name__))
+        name, symbol, function = _BINARY_OPERATORS[type(node.op)]
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if left[0] == 'const' and right[0] == 'const':
+            return 'const', function(left[1], right[1])
+        if left[0] == 'const':
+            raise TypeError(
+                'The left operand of "{}" must depend on a variable, Number '
+                'does not support reflected operators.'.format(symbol))
+        if name == 'pow' and right[0] == 'num':
+            raise TypeError(
+                'Only exponentiating by a constant (float or int) is '
+                'supported.')
+        n = self.allocate()
+        a = left[1]
+        if right[0] == 'const':
+            b = 'c{}'.format(len(self.constants))
+            self.constants[b] = right[1]
+            getattr(self, 'emit_' + name + '_const')(n, a, b, symbol)
+        else:
+            getattr(self, 'emit_' + name)(n, a, right[1], symbol)
+        return 'num', n
+
+    def allocate(self) -> int:
+        """Reserve the index of a new node."""
+        self.count += 1
+        return self.count - 1
+
+    def emit(self, *lines: str, **names) -> None:
+        """Append formatted lines to the body of the kernel."""
+        for line in lines:
+            self.lines.append('    ' + line.format(**names))
+
+    def emit_range(self, a: int) -> None:
+        """Emit the min_value and max_value of a node inside a tolerance
+        branch."""
+        self.emit(
+            '    f{a} = _round(v{a}, l{a})',
+            '    e{a} = t{a} or 0',
+            '    x{a} = max(f{a} + e{a}, f{a} - e{a})',
+            '    m{a} = min(f{a} + e{a}, f{a} - e{a})', a=a)
+
+    def emit_tolerance(self, n: int, a: int, b, expression: str) -> None:
+        """Emit a tolerance that is None only when no operand has one."""
+        if isinstance(b, int):
+            self.emit('if t{a} is None and t{b} is None:', a=a, b=b)
+        else:
+            self.emit('if t{a} is None:', a=a)
+        self.emit('    t{n} = None', 'else:', n=n)
+        if 'x{a}' in expression:
+            self.emit_range(a)
+            if isinstance(b, int):
+                self.emit_range(b)
+        self.emit('    t{n} = abs(' + expression + ')', n=n, a=a, b=b)
+
+    def emit_lsd_rule(self, n: int, a: int, b, symbol: str) -> None:
+        """Addition and subtraction keep the coarsest least significant
+        digit."""
+        if isinstance(b, int):
+            self.emit(
+                'v{n} = v{a} ' + symbol + ' v{b}',
+                'l{n} = max(l{a}, l{b})',
+                's{n} = _sig(v{n}, l{n})',
+                'if t{a} is None and t{b} is None:',
+                '    t{n} = None',
+                'else:',
+                '    t{n} = abs((t{a} or 0) + (t{b} or 0))', n=n, a=a, b=b)
+        else:
+            self.emit(
+                'v{n} = v{a} ' + symbol + ' {b}',
+                'l{n} = l{a}',
+                's{n} = _sig(v{n}, l{n})',
+                't{n} = t{a}', n=n, a=a, b=b)
+
+    emit_add = emit_add_const = emit_lsd_rule
+    emit_sub = emit_sub_const = emit_lsd_rule
+
+    def emit_mul(self, n: int, a: int, b: int, _symbol: str) -> None:
+        """Multiplication keeps the fewest significant digits."""
+        self.emit(
+            'v{n} = v{a} * v{b}',
+            's{n} = min(s{a}, s{b})',
+            'l{n} = _lsd(v{n}, s{n})', n=n, a=a, b=b)
+        self.emit_tolerance(
+            n, a, b,
+            'abs((t{a} or 0) * v{b}) + abs((t{b} or 0) * v{a}) + '
+            '(t{a} or 0) * (t{b} or 0)')
+
+    def emit_mul_const(self, n: int, a: int, b: str, _symbol: str) -> None:
+        """Multiplication by a constant keeps the significant digits."""
+        self.emit(
+            'v{n} = v{a} * {b}',
+            's{n} = s{a}',
+            'l{n} = _lsd(v{n}, s{n})', n=n, a=a, b=b)
+        self.emit_tolerance(n, a, b, 't{a} * {b}')
+
+    def emit_quotient(self, n: int, a: int, b, symbol: str) -> None:
+        """Division, floor division and modulo of two Numbers."""
+        self.emit('v{n} = v{a} ' + symbol + ' v{b}', n=n, a=a, b=b)
+        if symbol == '//':
+            self.emit('s{n} = min(s{a}, s{b}, _isig(v{n})[0])', n=n, a=a, b=b)
+        else:
+            self.emit('s{n} = min(s{a}, s{b})', n=n, a=a, b=b)
+        self.emit('l{n} = _lsd(v{n}, s{n})', n=n)
+        other = '%' if symbol == '%' else '/'
+        self.emit_tolerance(
+            n, a, b,
+            'max(abs(abs(v{n}) - abs(x{a} ' + other + ' m{b})), '
+            'abs(abs(v{n}) - abs(m{a} ' + other + ' x{b})))')
+
+    emit_truediv = emit_floordiv = emit_mod = emit_quotient
+
+    def emit_truediv_const(self, n: int, a: int, b: str, _symbol: str) -> None:
+        """Division by a constant keeps the significant digits."""
+        self.emit(
+            'v{n} = v{a} / {b}',
+            's{n} = s{a}',
+            'l{n} = _lsd(v{n}, s{n})', n=n, a=a, b=b)
+        self.emit_tolerance(n, a, b, 't{a} / {b}')
+
+    def emit_floordiv_const(
+            self, n: int, a: int, b: str, _symbol: str) -> None:
+        """Floor division by a constant."""
+        self.emit(
+            'v{n} = v{a} // {b}',
+            's{n} = min(s{a}, _isig(v{n})[0])',
+            'l{n} = _lsd(v{n}, s{n})', n=n, a=a, b=b)
+        self.emit_tolerance(
+            n, a, b,
+            'abs(v{n}) - abs(x{a} / {b})')
+
+    def emit_mod_const(self, n: int, a: int, b: str, _symbol: str) -> None:
+        """Modulo division by a constant keeps the significant digits."""
+        self.emit_extremum_const(n, a, b, '%')
+
+    def emit_pow_const(self, n: int, a: int, b: str, _symbol: str) -> None:
+        """Exponentiation by a constant keeps the significant digits."""
+        self.emit_extremum_const(n, a, b, '**')
+
+    def emit_extremum_const(self, n: int, a: int, b: str, symbol: str) -> None:
+        """Operations whose tolerance is the largest deviation at either end
+        of the operand's range."""
+        self.emit(
+            'v{n} = v{a} ' + symbol + ' {b}',
+            's{n} = s{a}',
+            'l{n} = _lsd(v{n}, s{n})', n=n, a=a, b=b)
+        self.emit_tolerance(
+            n, a, b,
+            'max(abs(abs(v{n}) - abs(x{a} ' + symbol + ' {b})), '
+            'abs(abs(v{n}) - abs(m{a} ' + symbol + ' {b})))')
+
+
+def compile(  # pylint: disable=redefined-builtin
+        expression: str,
+        variables: Optional[Sequence[str]] = None) -> Formula:
+    """Parse a formula such as "(a * b - c) / d ** 2" once and return a
+    Formula that evaluates it on Numbers, or on equal length columns of
+    Numbers, with the same results as evaluating it operator by operator.
+    If variables is omitted they are taken in order of first appearance."""
+    tree = ast.parse(expression.strip(), mode='eval')
+    if variables is None:
+        variables = []
+        names = sorted(
+            (node for node in ast.walk(tree) if isinstance(node, ast.Name)),
+            key=lambda node: (node.lineno, node.col_offset))
+        for node in names:
+            if node.id not in variables:
+                variables.append(node.id)
+    elif len(set(variables)) != len(variables):
+        raise ValueError('Variable names must be unique.')
+    source, namespace = _KernelBuilder(variables).build(tree)
+    exec(builtins.compile(  # pylint: disable=exec-used
+        source, '<formula {!r}>'.format(expression), 'exec'), namespace)
+    return Formula(expression, variables, source, namespace['_kernel'])
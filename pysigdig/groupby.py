@@ -0,0 +1,268 @@
+"""Module to aggregate streams of keyed Numbers in columnar buffers."""
+
+
+from array import array
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Union
+import math
+
+from .pysigdig import Number
+
+
+_NAN = float('nan')
+_INF = float('inf')
+_COLUMNS = ('values', 'sigdigs', 'lsd', 'tolerance')
+_EXACT = 2 ** 53  # every integer up to here is exact as a double
+
+
+def _as_list(column) -> list:
+    """Get a list of Python scalars from a sequence or numpy array."""
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+def _broadcast(parameter, length: int) -> Optional[list]:
+    if parameter is None:
+        return None
+    if hasattr(parameter, 'tolist'):
+        parameter = parameter.tolist()
+    if isinstance(parameter, (int, float)):
+        return [parameter] * length
+    parameter = list(parameter)
+    if len(parameter) != length:
+        raise ValueError('Parameter must be a scalar or match the values.')
+    return parameter
+
+
+def _read(values: array, is_int: int, exact: dict,
+          slot: int) -> Union[int, float]:
+    """Get the value in a slot, as an int if it holds one."""
+    if not is_int:
+        return values[slot]
+    return exact[slot] if slot in exact else int(values[slot])
+
+
+def _write(values: array, exact: dict, slot: int,
+           value: Union[int, float]) -> None:
+    """Put a value in a slot, moving integers that a double cannot hold
+    exactly to the side table."""
+    if isinstance(value, int) and abs(value) > _EXACT:
+        values[slot] = 0
+        exact[slot] = value
+        return
+    values[slot] = value
+    if exact:
+        exact.pop(slot, None)
+
+
+class KeyedAggregator:
+    """Aggregate (key, Number) pairs per key. A hash table maps every key to a
+    slot in fixed width columns holding the running state, so no Number is
+    created until a result is requested. Sums follow the rules of repeated
+    Number.__add__ in the order of the updates, the mean is the sum divided by
+    the count, and min and max keep the Number with the extreme value.
+    Integer values stay exact for as long as every value of a key is an
+    integer; those beyond 2**53 move to a side table."""
+
+    AGGREGATIONS = ('sum', 'mean', 'min', 'max')
+
+    def __init__(self, aggregations: Sequence[str] = AGGREGATIONS) -> None:
+        for name in aggregations:
+            if name not in self.AGGREGATIONS:
+                raise ValueError('Unknown aggregation "{}".'.format(name))
+        self._aggregations = tuple(aggregations)
+        self._index = {}  # type: Dict[Hashable, int]
+        self._count = array('q')
+        self._sum = None
+        self._min = None
+        self._max = None
+        if 'sum' in aggregations or 'mean' in aggregations:
+            self._sum = (array('d'), array('d'), array('d'), array('B'), {})
+        if 'min' in aggregations:
+            self._min = (
+                array('d'), array('d'), array('d'), array('d'), array('B'), {})
+        if 'max' in aggregations:
+            self._max = (
+                array('d'), array('d'), array('d'), array('d'), array('B'), {})
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def keys(self):
+        """Get the keys in order of first appearance."""
+        return self._index.keys()
+
+    def update(self, key: Hashable, number: Number) -> None:
+        """Add a Number to the aggregates of a key."""
+        self._update(key, number.components)
+
+    def update_batch(
+            self,
+            keys: Iterable[Hashable],
+            numbers: Iterable[Number]) -> None:
+        """Add Numbers to the aggregates of the matching keys."""
+        update = self._update
+        for key, number in zip(keys, numbers):
+            update(key, number.components)
+
+    def update_columns(
+            self,
+            keys: Sequence[Hashable],
+            values,
+            sigdigs=None,
+            lsd=None,
+            tolerance=None) -> None:
+        """Add columns of readings to the aggregates of the matching keys
+        without creating a Number per reading. Values may be a one
+        dimensional NumberArray or NumberColumn, or a sequence of ints and
+        floats read like the arguments of Number, with sigdigs, lsd and
+        tolerance each a scalar or one per value. A NaN tolerance is none."""
+        keys = _as_list(keys)
+        if all(hasattr(values, name) for name in _COLUMNS):
+            columns = [_as_list(getattr(values, name)) for name in _COLUMNS]
+            if len(columns[0]) != len(keys):
+                raise ValueError('Keys and values must have the same length.')
+            for key, value, count, place, tol in zip(keys, *columns):
+                self._update(key, (
+                    value,
+                    int(count) if math.isfinite(count) else count,
+                    place,
+                    None if math.isnan(tol) else tol))
+            return
+        values = _as_list(values)
+        if len(values) != len(keys):
+            raise ValueError('Keys and values must have the same length.')
+        sigdigs = _broadcast(sigdigs, len(values))
+        lsd = _broadcast(lsd, len(values))
+        tolerance = _broadcast(tolerance, len(values))
+        for i, (key, value) in enumerate(zip(keys, values)):
+            if isinstance(value, int):
+                count, place = Number.get_sigdigs_from_int(value)
+            else:
+                count, place = _INF, -_INF
+            if sigdigs is not None:
+                count = sigdigs[i]
+                place = Number.get_lsd_from_sigdigs(value, count)
+            if lsd is not None:
+                place = lsd[i]
+                count = None  # derived by _store if the value is kept
+            tol = None if tolerance is None else tolerance[i]
+            self._update(key, (
+                value, count, place,
+                None if tol is None or math.isnan(tol) else abs(tol)))
+
+    def _update(self, key: Hashable, components: tuple) -> None:
+        value, _, lsd, tolerance = components
+        slot = self._index.get(key)
+        if slot is None:
+            self._insert(key, components)
+            return
+        self._count[slot] += 1
+        if self._sum is not None:
+            values, lsds, tolerances, is_int, exact = self._sum
+            if not is_int[slot]:
+                values[slot] += value
+            else:
+                is_int[slot] = isinstance(value, int)
+                _write(values, exact, slot, _read(
+                    values, 1, exact, slot) + value)
+            if lsd > lsds[slot]:
+                lsds[slot] = lsd
+            if tolerance is not None:
+                if math.isnan(tolerances[slot]):
+                    tolerances[slot] = tolerance
+                else:
+                    tolerances[slot] += tolerance
+        if self._min is not None and value < self._extreme(self._min, slot):
+            self._store(self._min, slot, components)
+        if self._max is not None and value > self._extreme(self._max, slot):
+            self._store(self._max, slot, components)
+
+    def count(self, key: Hashable) -> int:
+        """Get the number of updates of a key."""
+        return self._count[self._index[key]]
+
+    def sum(self, key: Hashable) -> Number:
+        """Get the sum of the Numbers of a key."""
+        if self._sum is None:
+            raise ValueError('Sums are not being aggregated.')
+        slot = self._index[key]
+        values, lsds, tolerances, is_int, exact = self._sum
+        value = _read(values, is_int[slot], exact, slot)
+        tolerance = tolerances[slot]
+        return Number.from_components(
+            value,
+            Number.get_sigdigs_from_lsd(value, lsds[slot]),
+            lsds[slot],
+            None if math.isnan(tolerance) else tolerance)
+
+    def mean(self, key: Hashable) -> Number:
+        """Get the mean of the Numbers of a key."""
+        if 'mean' not in self._aggregations:
+            raise ValueError('Means are not being aggregated.')
+        return self.sum(key) / self.count(key)
+
+    def min(self, key: Hashable) -> Number:
+        """Get the Number with the smallest value of a key."""
+        if self._min is None:
+            raise ValueError('Minimums are not being aggregated.')
+        return self._load(self._min, self._index[key])
+
+    def max(self, key: Hashable) -> Number:
+        """Get the Number with the largest value of a key."""
+        if self._max is None:
+            raise ValueError('Maximums are not being aggregated.')
+        return self._load(self._max, self._index[key])
+
+    def result(self, key: Hashable) -> Dict[str, Number]:
+        """Get every aggregate of a key by name."""
+        return {name: getattr(self, name)(key) for name in self._aggregations}
+
+    def results(self) -> Dict[Hashable, Dict[str, Number]]:
+        """Get every aggregate of every key."""
+        return {key: self.result(key) for key in self._index}
+
+    def _insert(self, key: Hashable, components: tuple) -> None:
+        value, _, lsd, tolerance = components
+        self._index[key] = len(self._count)
+        self._count.append(1)
+        if self._sum is not None:
+            values, lsds, tolerances, is_int, exact = self._sum
+            values.append(0)
+            lsds.append(lsd)
+            tolerances.append(_NAN if tolerance is None else tolerance)
+            is_int.append(isinstance(value, int))
+            _write(values, exact, len(self._count) - 1, value)
+        for columns in (self._min, self._max):
+            if columns is not None:
+                for column in columns[:-1]:
+                    column.append(0)
+                self._store(columns, len(self._count) - 1, components)
+
+    @staticmethod
+    def _store(columns: tuple, slot: int, components: tuple) -> None:
+        value, sigdigs, lsd, tolerance = components
+        values, sigdigss, lsds, tolerances, is_int, exact = columns
+        if sigdigs is None:
+            sigdigs = Number.get_sigdigs_from_lsd(value, lsd)
+        sigdigss[slot] = sigdigs
+        lsds[slot] = lsd
+        tolerances[slot] = _NAN if tolerance is None else tolerance
+        is_int[slot] = isinstance(value, int)
+        _write(values, exact, slot, value)
+
+    @staticmethod
+    def _extreme(columns: tuple, slot: int) -> Union[int, float]:
+        values, _, _, _, is_int, exact = columns
+        return _read(values, is_int[slot], exact, slot)
+
+    @classmethod
+    def _load(cls, columns: tuple, slot: int) -> Number:
+        _, sigdigss, lsds, tolerances, _, _ = columns
+        tolerance = tolerances[slot]
+        return Number.from_components(
+            cls._extreme(columns, slot),
+            sigdigss[slot],
+            lsds[slot],
+            None if math.isnan(tolerance) else tolerance)
@@ -0,0 +1,156 @@
+"""Module with linear algebra on NumberArrays."""
+
+
+from typing import Union
+
+from .numberarray import NumberArray, numpy, require_numpy
+from .pysigdig import Number
+from .rounding import lsd_from_sigdigs, sigdigs_from_lsd
+
+
+_BLOCK = 64  # rows per block of the max-plus product, sized for the cache
+_MARGIN = 1e-3  # distance from an integer below which logs are rechecked
+
+
+def _power_of_ten(exponents):
+    """Get the least significant digit Number uses for each decimal exponent,
+    zero for an exponent of minus infinity."""
+    result = numpy.zeros(exponents.shape)
+    finite = numpy.isfinite(exponents)
+    whole = exponents[finite].astype(numpy.int64)
+    result[finite] = numpy.where(
+        whole > 0,
+        10.0 ** numpy.maximum(whole, 0),
+        lsd_from_sigdigs(numpy.ones(whole.shape), 1 - numpy.minimum(whole, 0)))
+    return result
+
+
+def _max_plus(left, right):
+    """Get max over k of left[0][i, k] + right[0][k, j] and of
+    left[1][i, k] + right[1][k, j], computed in float32 blocks of rows."""
+    rows, inner = left[0].shape
+    result = numpy.empty((rows, right[0].shape[1]), dtype=numpy.float32)
+    left = [part.astype(numpy.float32) for part in left]
+    right = [part.astype(numpy.float32) for part in right]
+    for start in range(0, rows, _BLOCK):
+        block = result[start:start + _BLOCK]
+        block.fill(-numpy.inf)
+        scratch = numpy.empty_like(block)
+        for first, second in zip(left, right):
+            part = first[start:start + _BLOCK]
+            for k in range(inner):
+                numpy.add(part[:, k, None], second[k], out=scratch)
+                numpy.maximum(block, scratch, out=block)
+    return result
+
+
+def _exact_exponent(a: NumberArray, b: NumberArray, i: int, j: int) -> float:
+    """Get the largest decimal exponent of the least significant digits of
+    the products a[i, k] * b[k, j] with the rules of Number.__mul__."""
+    lsd = lsd_from_sigdigs(
+        a.values[i] * b.values[:, j],
+        numpy.minimum(a.sigdigs[i], b.sigdigs[:, j])).max()
+    return numpy.rint(numpy.log10(lsd)) if lsd > 0 else -numpy.inf
+
+
+def _lsd_exponents(a: NumberArray, b: NumberArray):
+    """Get the decimal exponent of the coarsest least significant digit of
+    the products summed into every element of a @ b.
+
+    The exponent of a product is floor(log10|a * b|) - min(sa, sb) + 1, and
+    floor(x - s) is max(floor(x - sa), floor(x - sb)), so the maximum over k
+    is a pair of max-plus products of the logs. Elements whose maximum is
+    too close to an integer to trust the float32 logs are recomputed from
+    the products themselves."""
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        log_a = numpy.log10(numpy.abs(a.values))
+        log_b = numpy.log10(numpy.abs(b.values))
+        peak = _max_plus(
+            (log_a - a.sigdigs, log_a), (log_b, log_b - b.sigdigs))
+        exponents = numpy.floor(peak).astype(numpy.float64) + 1
+        doubtful = numpy.isfinite(peak) & (
+            numpy.abs(peak - numpy.rint(peak)) < _MARGIN)
+    for i, j in zip(*numpy.nonzero(doubtful)):
+        exponents[i, j] = _exact_exponent(a, b, i, j)
+    zero = (a.values == 0).any(axis=1)[:, None] | \
+        (b.values == 0).any(axis=0)[None, :]
+    return numpy.where(zero, numpy.maximum(exponents, 0), exponents)
+
+
+def _as_matrices(a: NumberArray, b: NumberArray) -> tuple:
+    if not isinstance(a, NumberArray) or not isinstance(b, NumberArray):
+        raise TypeError('Operands must be NumberArrays.')
+    if a.ndim not in (1, 2) or b.ndim not in (1, 2):
+        raise ValueError('Operands must have one or two dimensions.')
+    left = a if a.ndim == 2 else a[None, :]
+    right = b if b.ndim == 2 else b[:, None]
+    if left.shape[1] != right.shape[0]:
+        raise ValueError('Shapes {} and {} are not aligned.'.format(
+            a.shape, b.shape))
+    return left, right
+
+
+def matmul(a: NumberArray, b: NumberArray) -> Union[NumberArray, Number]:
+    """Matrix product of one or two dimensional NumberArrays, following the
+    rules of Number.__mul__ for every product and Number.__add__ for their
+    sum. Values and tolerances are computed with BLAS, so sums may differ
+    from adding one product at a time in the last place. The least
+    significant digit of each element is the coarsest power of ten among
+    those of its products, and the significant digits follow from it. A
+    product of two vectors is a Number."""
+    require_numpy('matmul')
+    left, right = _as_matrices(a, b)
+    values = left.values @ right.values
+    has_a = ~numpy.isnan(left.tolerance)
+    has_b = ~numpy.isnan(right.tolerance)
+    tol_a = numpy.where(has_a, left.tolerance, 0)
+    tol_b = numpy.where(has_b, right.tolerance, 0)
+    tolerance = tol_a @ numpy.abs(right.values) + \
+        numpy.abs(left.values) @ tol_b + tol_a @ tol_b
+    tolerance[~(has_a.any(axis=1)[:, None] | has_b.any(axis=0)[None, :])] = \
+        numpy.nan
+    if left.shape[1] == 1:
+        sigdigs = numpy.minimum(left.sigdigs, right.sigdigs)
+        lsd = lsd_from_sigdigs(values, sigdigs)
+    else:
+        lsd = _power_of_ten(_lsd_exponents(left, right))
+        sigdigs = sigdigs_from_lsd(values, lsd)
+    result = NumberArray.from_components(values, sigdigs, lsd, tolerance)
+    if a.ndim == 1 and b.ndim == 1:
+        return result[0, 0]
+    if a.ndim == 1:
+        return result[0]
+    if b.ndim == 1:
+        return result[:, 0]
+    return result
+
+
+def dot(a: NumberArray, b: NumberArray) -> Union[NumberArray, Number]:
+    """Dot product of one or two dimensional NumberArrays, the same as
+    matmul for these shapes."""
+    return matmul(a, b)
+
+
+def solve(a: NumberArray, b: NumberArray) -> NumberArray:
+    """Solve a @ x = b for a small dense square a. Every element of x is a
+    quotient of products of all of a and its column of b, so it keeps the
+    fewest significant digits among them, and its tolerance is the first
+    order bound |inv(a)| @ (tol_b + tol_a @ |x|)."""
+    require_numpy('solve')
+    if not isinstance(a, NumberArray) or not isinstance(b, NumberArray):
+        raise TypeError('Operands must be NumberArrays.')
+    if a.ndim != 2 or a.shape[0] != a.shape[1]:
+        raise ValueError('Coefficients must be a square matrix.')
+    right = b if b.ndim == 2 else b[:, None]
+    values = numpy.linalg.solve(a.values, right.values)
+    sigdigs = numpy.minimum(a.sigdigs.min(), right.sigdigs.min(axis=0))
+    sigdigs = numpy.broadcast_to(sigdigs, values.shape)
+    has_a = ~numpy.isnan(a.tolerance)
+    has_b = ~numpy.isnan(right.tolerance)
+    tolerance = numpy.abs(numpy.linalg.inv(a.values)) @ (
+        numpy.where(has_b, right.tolerance, 0) +
+        numpy.where(has_a, a.tolerance, 0) @ numpy.abs(values))
+    tolerance[:, ~(has_a.any() | has_b.any(axis=0))] = numpy.nan
+    result = NumberArray.from_components(
+        values, sigdigs, lsd_from_sigdigs(values, sigdigs), tolerance)
+    return result if b.ndim == 2 else result[:, 0]
@@ -0,0 +1,160 @@
+"""Module with a numpy backed array of Numbers."""
+
+
+from typing import Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .pysigdig import Number
+from .rounding import (
+    lsd_from_sigdigs, round_to_lsd, sigdigs_from_int, sigdigs_from_lsd)
+
+
+def require_numpy(feature: str) -> None:
+    """Raise an ImportError naming the feature if numpy is missing."""
+    if numpy is None:
+        raise ImportError(
+            '{} requires numpy, install it with "pip install '
+            'pysigdig[numpy]".'.format(feature))
+
+
+class NumberArray:
+    """Array of Numbers stored as four float64 columns of the same shape:
+    values, significant digits, least significant digits and tolerances,
+    where a tolerance of NaN stands for None. Values are stored unrounded,
+    like the value of a Number, and integer arrays get the significant digits
+    of Number(int)."""
+
+    def __init__(
+            self,
+            values,
+            sigdigs=None,
+            lsd=None,
+            tolerance=None) -> None:
+        require_numpy('NumberArray')
+        values = numpy.asarray(values)
+        self._values = numpy.array(values, dtype=numpy.float64)
+        if numpy.issubdtype(values.dtype, numpy.integer):
+            self._sigdigs, self._lsd = sigdigs_from_int(values)
+        else:
+            self._sigdigs = numpy.full(self._values.shape, numpy.inf)
+            self._lsd = numpy.full(self._values.shape, -numpy.inf)
+        if sigdigs is not None:
+            self._sigdigs = numpy.array(numpy.broadcast_to(
+                numpy.asarray(sigdigs, dtype=numpy.float64),
+                self._values.shape))
+            self._lsd = lsd_from_sigdigs(self._values, self._sigdigs)
+        if lsd is not None:
+            self._lsd = numpy.array(numpy.broadcast_to(
+                numpy.asarray(lsd, dtype=numpy.float64), self._values.shape))
+            self._sigdigs = sigdigs_from_lsd(self._values, self._lsd)
+        self._tolerance = numpy.full(self._values.shape, numpy.nan)
+        if tolerance is not None:
+            self._tolerance = numpy.abs(numpy.array(numpy.broadcast_to(
+                numpy.asarray(tolerance, dtype=numpy.float64),
+                self._values.shape)))
+
+    @classmethod
+    def from_components(
+            cls,
+            values,
+            sigdigs,
+            lsd,
+            tolerance) -> 'NumberArray':
+        """Create a NumberArray directly from its four columns without
+        deriving the significant digits or least significant digits again."""
+        require_numpy('NumberArray')
+        array = cls.__new__(cls)
+        array._values = numpy.asarray(values, dtype=numpy.float64)
+        shape = array._values.shape
+        array._sigdigs = numpy.broadcast_to(
+            numpy.asarray(sigdigs, dtype=numpy.float64), shape)
+        array._lsd = numpy.broadcast_to(
+            numpy.asarray(lsd, dtype=numpy.float64), shape)
+        array._tolerance = numpy.broadcast_to(
+            numpy.asarray(tolerance, dtype=numpy.float64), shape)
+        return array
+
+    @classmethod
+    def from_numbers(cls, numbers: Sequence) -> 'NumberArray':
+        """Create a NumberArray from a (nested) sequence of Numbers."""
+        require_numpy('NumberArray')
+        objects = numpy.empty(numpy.shape(numbers), dtype=object)
+        objects[...] = numbers
+        components = [number.components for number in objects.ravel()]
+        shape = objects.shape
+        return cls.from_components(
+            numpy.array([c[0] for c in components], float).reshape(shape),
+            numpy.array([c[1] for c in components], float).reshape(shape),
+            numpy.array([c[2] for c in components], float).reshape(shape),
+            numpy.array(
+                [numpy.nan if c[3] is None else c[3] for c in components],
+                float).reshape(shape))
+
+    def to_numbers(self) -> list:
+        """Convert to a (nested) list of Numbers."""
+        if self.ndim == 0:
+            return self[()]
+        return [item.to_numbers() if isinstance(item, NumberArray) else item
+                for item in self]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index) -> Union[Number, 'NumberArray']:
+        values = self._values[index]
+        if numpy.ndim(values) == 0:
+            tolerance = float(self._tolerance[index])
+            sigdigs = float(self._sigdigs[index])
+            return Number.from_components(
+                float(values),
+                int(sigdigs) if numpy.isfinite(sigdigs) else sigdigs,
+                float(self._lsd[index]),
+                None if numpy.isnan(tolerance) else tolerance)
+        return NumberArray.from_components(
+            values,
+            self._sigdigs[index],
+            self._lsd[index],
+            self._tolerance[index])
+
+    def rounded(self):
+        """Get the values rounded to their least significant digits, like
+        float(Number) does."""
+        return round_to_lsd(self._values, self._lsd)
+
+    @property
+    def values(self):
+        """Get the unrounded values."""
+        return self._values
+
+    @property
+    def sigdigs(self):
+        """Get the significant digits."""
+        return self._sigdigs
+
+    @property
+    def lsd(self):
+        """Get the least significant digits."""
+        return self._lsd
+
+    @property
+    def tolerance(self):
+        """Get the tolerances, NaN where there is none."""
+        return self._tolerance
+
+    @property
+    def shape(self) -> tuple:
+        """Get the shape of the array."""
+        return self._values.shape
+
+    @property
+    def ndim(self) -> int:
+        """Get the number of dimensions."""
+        return self._values.ndim
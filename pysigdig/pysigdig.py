@@ -44,9 +44,7 @@ class Number:
         return int(float(self))
 
     def __float__(self) -> float:
-        if self.lsd == float('-inf'):
-            return self._value
-        return float(round(self._value, int(-math.log10(self.lsd))))
+        return Number.round_to_lsd(self._value, self.lsd)
 
     def __str__(self) -> str:
         digits = int(-math.log10(self.lsd))
@@ -271,36 +269,12 @@ class Number:
     def set_lsd_from_sigdigs(self):
         """Determine the least significant digit based on the specified number
         of significant digits and the current value."""
-        temp_value = self._value
-        if temp_value < 0:
-            temp_value = 0 - temp_value
-        place = 1
-        if temp_value >= 1:
-            while temp_value > 0:
-                place *= 10
-                temp_value -= temp_value % place
-            place /= 10
-        elif temp_value == 0:
-            self._lsd = 1
-            return
-        else:
-            place = float(place)
-            while temp_value % place == temp_value:
-                place /= 10
-        self._lsd = float(place) / 10 ** (self.sigdigs - 1)
+        self._lsd = Number.get_lsd_from_sigdigs(self._value, self.sigdigs)
 
     def set_sigdigs_from_lsd(self):
         """Determine the number of significant digits based on the specified
         least significant digit and current value."""
-        temp_value = self._value
-        if temp_value < 0:
-            temp_value = 0 - temp_value
-        place = float(self.lsd)
-        self._sigdigs = 1
-        while temp_value / place >= 1:
-            self._sigdigs += 1
-            place *= 10
-        self._sigdigs -= 1
+        self._sigdigs = Number.get_sigdigs_from_lsd(self._value, self.lsd)
 
     @property
     def value(self):
@@ -336,6 +310,76 @@ class Number:
         """Get tolerance."""
         return self._tolerance
 
+    @property
+    def components(self):
+        """Get the unrounded value, significant digits, least significant digit
+        and tolerance as a tuple."""
+        return self._value, self._sigdigs, self._lsd, self._tolerance
+
+    @classmethod
+    def from_components(
+            cls,
+            value: Union[int, float],
+            sigdigs: Union[int, float],
+            lsd: Union[int, float],
+            tolerance: Union[int, float, None] = None) -> 'Number':
+        """Create a Number directly from its components without deriving the
+        significant digits or least significant digit again."""
+        number = cls.__new__(cls)
+        number._value = value
+        number._sigdigs = sigdigs
+        number._lsd = lsd
+        number._tolerance = tolerance
+        return number
+
+    @staticmethod
+    def get_lsd_from_sigdigs(
+            value: Union[int, float],
+            sigdigs: Union[int, float]) -> Union[int, float]:
+        """Get the least significant digit of a value with the given number of
+        significant digits."""
+        temp_value = value
+        if temp_value < 0:
+            temp_value = 0 - temp_value
+        place = 1
+        if temp_value >= 1:
+            while temp_value > 0:
+                place *= 10
+                temp_value -= temp_value % place
+            place /= 10
+        elif temp_value == 0:
+            return 1
+        else:
+            place = float(place)
+            while temp_value % place == temp_value:
+                place /= 10
+        return float(place) / 10 ** (sigdigs - 1)
+
+    @staticmethod
+    def get_sigdigs_from_lsd(
+            value: Union[int, float],
+            lsd: Union[int, float]) -> int:
+        """Get the number of significant digits of a value with the given
+        least significant digit."""
+        temp_value = value
+        if temp_value < 0:
+            temp_value = 0 - temp_value
+        place = float(lsd)
+        sigdigs = 1
+        while temp_value / place >= 1:
+            sigdigs += 1
+            place *= 10
+        return sigdigs - 1
+
+    @staticmethod
+    def round_to_lsd(
+            value: Union[int, float],
+            lsd: Union[int, float]) -> Union[int, float]:
+        """Round a value to the given least significant digit."""
+        if lsd == float('-inf'):
+            return value
+        return float(round(value, int(-math.log10(lsd))))
+
     @staticmethod
     def get_sigdigs_from_int(value: int):
         """Get the number of significant digits from an integer"""
@@ -0,0 +1,315 @@
+"""Module to round arrays of floats to significant digits without creating a
+Number per value."""
+
+
+from array import array
+from decimal import (
+    Context, Decimal, MAX_EMAX, MIN_EMIN, ROUND_CEILING, ROUND_DOWN,
+    ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP)
+from typing import Sequence, Union
+import math
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .pysigdig import Number
+
+
+ROUNDING_MODES = (
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN, ROUND_UP, ROUND_DOWN,
+    ROUND_CEILING, ROUND_FLOOR)
+
+_CONTEXT = Context(prec=2000, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+def _powers_of_ten() -> tuple:
+    """Every power of ten that Number.get_lsd_from_sigdigs can produce:
+    exact integer powers for values of at least one, and repeated division by
+    ten for values below one."""
+    powers = [float(10 ** k) for k in range(309)]
+    fractions = [1.0]
+    while fractions[-1] > 0:
+        fractions.append(fractions[-1] / 10)
+    fractions.reverse()
+    if numpy is None:
+        return powers, fractions
+    return numpy.array(powers), numpy.array(fractions)
+
+
+_POWERS, _FRACTIONS = _powers_of_ten()
+
+_EXACT_DIGITS = 22  # 10 ** 22 is the largest power of ten a double holds
+
+
+def _round_scalar(value: float, lsd: float, mode: str) -> float:
+    """Round one value like Number.round_to_lsd with a rounding mode. Other
+    modes round the shortest repr of the value, so a float that prints as a
+    multiple of the least significant digit is left where it is."""
+    if mode == ROUND_HALF_EVEN or not math.isfinite(value):
+        return float(Number.round_to_lsd(value, lsd))
+    if lsd == float('-inf'):
+        return value
+    return float(Decimal(repr(float(value))).quantize(
+        Decimal(1).scaleb(-int(-math.log10(lsd))),
+        rounding=mode,
+        context=_CONTEXT))
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in ROUNDING_MODES:
+        raise ValueError('Unsupported rounding mode "{}".'.format(mode))
+
+
+def _check_sigdigs(sigdigs) -> None:
+    if numpy is not None:
+        valid = numpy.all(numpy.isfinite(sigdigs) & (numpy.asarray(
+            sigdigs) >= 1))
+    else:
+        valid = math.isfinite(sigdigs) and sigdigs >= 1
+    if not valid:
+        raise ValueError('Significant digits must be finite and at least 1.')
+
+
+def _digits(lsd):
+    """Get the decimal places int(-log10(lsd)) used by Number.__float__,
+    evaluated once per distinct least significant digit."""
+    lsd = numpy.asarray(lsd, dtype=numpy.float64)
+    if numpy.any(numpy.isnan(lsd) | (lsd <= 0) & (lsd != -numpy.inf)):
+        raise ValueError('Least significant digits must be positive.')
+    unique, inverse = numpy.unique(lsd, return_inverse=True)
+    digits = numpy.array(
+        [0 if u == -numpy.inf else int(-math.log10(u)) for u in unique],
+        dtype=numpy.int64)
+    return digits[inverse].reshape(lsd.shape), lsd == -numpy.inf
+
+
+def _round_integers(scaled, mode: str):
+    """Round scaled values to integers and get their distance from the values
+    where the rounding mode changes direction."""
+    magnitude = numpy.abs(scaled)
+    fraction = magnitude - numpy.floor(magnitude)
+    if mode in (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN):
+        distance = numpy.abs(fraction - 0.5)
+    else:
+        distance = numpy.minimum(fraction, 1 - fraction)
+    if mode == ROUND_HALF_EVEN:
+        rounded = numpy.rint(scaled)
+    elif mode == ROUND_HALF_UP:
+        rounded = numpy.copysign(numpy.floor(magnitude + 0.5), scaled)
+    elif mode == ROUND_HALF_DOWN:
+        rounded = numpy.copysign(numpy.ceil(magnitude - 0.5), scaled)
+    elif mode == ROUND_UP:
+        rounded = numpy.copysign(numpy.ceil(magnitude), scaled)
+    elif mode == ROUND_DOWN:
+        rounded = numpy.trunc(scaled)
+    elif mode == ROUND_CEILING:
+        rounded = numpy.ceil(scaled)
+    else:
+        rounded = numpy.floor(scaled)
+    return rounded, distance
+
+
+def _on_grid(values, scaled, scale, positive):
+    """Find the values that are the nearest double to a multiple of their
+    least significant digit, which every mode keeps as they are."""
+    nearest = numpy.rint(scaled)
+    with numpy.errstate(invalid='ignore', over='ignore'):
+        return numpy.where(
+            positive, nearest / scale, nearest * scale) == values
+
+
+def _round_array(values, lsd, mode: str, out) -> None:
+    """Round a float64 array to least significant digits into out.
+
+    Values are scaled by an exact power of ten, rounded and scaled back,
+    which gives the correctly rounded result of round(value, digits) unless
+    the scaled value lies within a few ulps of a rounding boundary. Values
+    that are already the nearest double to a multiple of the least
+    significant digit are kept as they are. The rest near a boundary, and
+    any outside the range where the scale is exact, are rounded one at a
+    time."""
+    digits, passthrough = _digits(lsd)
+    digits, passthrough = numpy.broadcast_arrays(digits, passthrough)
+    scale = _POWERS[numpy.minimum(
+        numpy.abs(digits), _EXACT_DIGITS)]
+    positive = digits >= 0
+    with numpy.errstate(invalid='ignore', over='ignore'):
+        scaled = numpy.where(positive, values * scale, values / scale)
+        result, distance = _round_integers(scaled, mode)
+        result = numpy.where(positive, result / scale, result * scale)
+    inexact = (numpy.abs(digits) > _EXACT_DIGITS) | (
+        numpy.abs(scaled) >= 2.0 ** 52)
+    keep = passthrough | ~numpy.isfinite(values) | (
+        ~inexact & _on_grid(values, scaled, scale, positive))
+    slow = ~keep & (
+        inexact | (distance <= 4 * numpy.spacing(numpy.abs(scaled))))
+    result = numpy.where(keep, values, result)
+    lsd = numpy.broadcast_to(lsd, values.shape)
+    for index in zip(*numpy.nonzero(slow)):
+        result[index] = _round_scalar(
+            float(values[index]), float(lsd[index]), mode)
+    out[...] = result
+
+
+def lsd_from_sigdigs(values, sigdigs):
+    """Vectorized Number.get_lsd_from_sigdigs for a float64 array. Beyond
+    2**53 the place of the leading digit that Number finds by repeated
+    float division can differ from the exact one, so values there are passed
+    to Number one at a time."""
+    magnitude = numpy.abs(values)
+    powers = _POWERS
+    fractions = _FRACTIONS
+    place = numpy.where(
+        magnitude >= 1,
+        powers[numpy.clip(
+            numpy.searchsorted(powers, magnitude, side='right') - 1,
+            0, len(powers) - 1)],
+        fractions[numpy.clip(
+            numpy.searchsorted(fractions, magnitude, side='right') - 1,
+            0, len(fractions) - 1)])
+    sigdigs = numpy.asarray(sigdigs, dtype=numpy.float64)
+    whole = numpy.isfinite(sigdigs) & (sigdigs >= 1) & (
+        sigdigs == numpy.floor(sigdigs))
+    divisor = powers[numpy.minimum(
+        numpy.where(whole, sigdigs, 1).astype(numpy.int64) - 1,
+        len(powers) - 1)]
+    if not numpy.all(whole):
+        with numpy.errstate(over='ignore'):
+            divisor = numpy.where(whole, divisor, 10.0 ** (sigdigs - 1))
+    result = numpy.where(magnitude == 0, 1.0, place / divisor)
+    large = numpy.isfinite(magnitude) & (magnitude >= 2.0 ** 53)
+    if numpy.any(large):
+        values, whole, sigdigs = numpy.broadcast_arrays(values, whole, sigdigs)
+        for index in zip(*numpy.nonzero(large)):
+            count = float(sigdigs[index])
+            result[index] = Number.get_lsd_from_sigdigs(
+                float(values[index]), int(count) if whole[index] else count)
+    return result
+
+
+def sigdigs_from_lsd(values, lsd):
+    """Vectorized Number.get_sigdigs_from_lsd for a float64 array, with
+    infinite significant digits where the least significant digit is zero."""
+    magnitude = numpy.abs(values)
+    place, magnitude = numpy.broadcast_arrays(
+        numpy.asarray(lsd, dtype=numpy.float64), magnitude)
+    place = place.copy()
+    sigdigs = numpy.zeros(place.shape)
+    exact = place == 0
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        active = ~exact & (magnitude / place >= 1)
+        while active.any():
+            sigdigs += active
+            place[active] *= 10
+            active &= magnitude / place >= 1
+    sigdigs[exact] = numpy.inf
+    return sigdigs
+
+
+def sigdigs_from_int(values):
+    """Vectorized Number.get_sigdigs_from_int for an integer array: the
+    trailing zeros of an integer are not significant."""
+    rest = numpy.abs(numpy.asarray(values, dtype=numpy.int64))
+    lsd = numpy.ones(rest.shape)
+    sigdigs = numpy.zeros(rest.shape)
+    trailing = (rest != 0) & (rest % 10 == 0)
+    while trailing.any():
+        lsd[trailing] *= 10
+        rest[trailing] //= 10
+        trailing &= rest % 10 == 0
+    active = rest != 0
+    while active.any():
+        sigdigs += active
+        rest //= 10
+        active = rest != 0
+    sigdigs[sigdigs == 0] = 1
+    return sigdigs, lsd
+
+
+def _prepare(values, inplace: bool):
+    """Get a float64 numpy array to round and the object to return."""
+    if isinstance(values, numpy.ndarray):
+        if not inplace:
+            return numpy.array(values, dtype=numpy.float64), None
+        if values.dtype != numpy.float64 or not values.flags.writeable:
+            raise TypeError(
+                'Rounding in place requires a writeable float64 array.')
+        return values, values
+    if isinstance(values, array):
+        if not inplace:
+            values = array('d', values)
+        elif values.typecode != 'd':
+            raise TypeError('Rounding in place requires an array of type d.')
+        return numpy.frombuffer(values, dtype=numpy.float64), values
+    if inplace:
+        raise TypeError(
+            'Rounding in place requires a numpy array or an array.array.')
+    values = array('d', values)
+    return numpy.frombuffer(values, dtype=numpy.float64), values
+
+
+def _round_python(values, lsds, mode: str, inplace: bool):
+    """Round value by value when numpy is not available."""
+    if inplace and (
+            not isinstance(values, array) or values.typecode != 'd'):
+        raise TypeError('Rounding in place requires an array of type d.')
+    result = values if inplace else array('d', values)
+    for i, (value, lsd) in enumerate(zip(result, lsds)):
+        result[i] = _round_scalar(value, lsd, mode)
+    return result
+
+
+def _broadcast(parameter, length: int) -> Sequence:
+    if isinstance(parameter, (int, float)):
+        return [parameter] * length
+    if len(parameter) != length:
+        raise ValueError('Parameter must be a scalar or match the values.')
+    return parameter
+
+
+def round_sigfigs(
+        values,
+        sigdigs: Union[int, Sequence[int]],
+        mode: str = ROUND_HALF_EVEN,
+        inplace: bool = False):
+    """Round every value to a number of significant digits, exactly like
+    float(Number(value, sigdigs=sigdigs)) does for the default mode. Values
+    may be a numpy array, an array.array or any sequence of floats, and
+    sigdigs a scalar or one count per value. Modes are the rounding constants
+    of the decimal module, and apply to the shortest repr of each value, so
+    0.1 rounded up to one decimal place stays 0.1. With inplace the numpy
+    array or array.array of doubles is overwritten and returned, otherwise a
+    new array of the same kind is returned."""
+    _check_mode(mode)
+    if numpy is None:
+        sigdigs = _broadcast(sigdigs, len(values))
+        for count in sigdigs:
+            _check_sigdigs(count)
+        lsds = [
+            Number.get_lsd_from_sigdigs(value, count)
+            for value, count in zip(values, sigdigs)]
+        return _round_python(values, lsds, mode, inplace)
+    _check_sigdigs(sigdigs)
+    work, result = _prepare(values, inplace)
+    _round_array(work, lsd_from_sigdigs(work, sigdigs), mode, work)
+    return work if result is None else result
+
+
+def round_to_lsd(
+        values,
+        lsd: Union[float, Sequence[float]],
+        mode: str = ROUND_HALF_EVEN,
+        inplace: bool = False):
+    """Round every value to a least significant digit, exactly like
+    Number.round_to_lsd does for the default mode. Accepts the same values,
+    modes and inplace option as round_sigfigs, and lsd may be a scalar or one
+    least significant digit per value."""
+    _check_mode(mode)
+    if numpy is None:
+        return _round_python(
+            values, _broadcast(lsd, len(values)), mode, inplace)
+    work, result = _prepare(values, inplace)
+    _round_array(work, lsd, mode, work)
+    return work if result is None else result
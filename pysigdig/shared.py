@@ -0,0 +1,199 @@
+"""Module with a NumberArray stored in shared memory, so that processes on one
+host can read the same Numbers without copying them."""
+
+
+from typing import Optional, Sequence
+import struct
+import sys
+import weakref
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # pragma: no cover
+    resource_tracker = shared_memory = None
+
+from .numberarray import NumberArray, numpy, require_numpy
+
+
+_HEADER = struct.Struct('<4sBB6q')
+_MAGIC = b'PSDA'
+_VERSION = 1
+_OFFSET = 64  # keep the columns aligned after the header
+
+
+def _require_shared_memory() -> None:
+    require_numpy('SharedNumberArray')
+    if shared_memory is None:
+        raise ImportError('SharedNumberArray requires Python 3.8 or later.')
+
+
+def _release(memory, owner: bool) -> None:
+    """Close a shared memory block and unlink it if this process owns it.
+    Columns that outlive the array keep the mapping alive until they are
+    freed themselves."""
+    try:
+        memory.close()
+    except BufferError:
+        memory._mmap = None  # pylint: disable=W0212
+        memory.close()
+    if owner:
+        try:
+            _unlink(memory)
+        except FileNotFoundError:
+            pass
+
+
+def _unlink(memory) -> None:
+    """Unlink a shared memory block. Attaching from a forked process
+    unregisters the block from the resource tracker it shares with its
+    creator, so it is registered again first."""
+    if sys.version_info < (3, 13):
+        resource_tracker.register(
+            memory._name, 'shared_memory')  # pylint: disable=W0212
+    memory.unlink()
+
+
+def _columns(memory, writable: bool) -> tuple:
+    """Get the four columns as arrays over a shared memory block. Each holds
+    an export of the buffer, so the block cannot be closed under it."""
+    magic, version, ndim, *shape = _HEADER.unpack_from(memory.buf)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError('Shared memory "{}" does not hold a '
+                         'NumberArray.'.format(memory.name))
+    count = int(numpy.prod(shape[:ndim]))
+    columns = tuple(
+        numpy.frombuffer(
+            memory.buf, dtype=numpy.float64, count=count,
+            offset=_OFFSET + 8 * count * i).reshape(shape[:ndim])
+        for i in range(4))
+    for column in columns:
+        column.flags.writeable = writable
+    return columns
+
+
+class SharedNumberArray(NumberArray):
+    """NumberArray whose four columns live in one shared memory block. The
+    process that creates it owns the block and unlinks it on unlink(), on
+    leaving a with block, or when the array is garbage collected. Other
+    processes attach by name and read the columns without copying; pickling
+    a SharedNumberArray sends only its name."""
+
+    def __init__(self, memory, owner: bool, writable: bool) -> None:
+        """Wrap an open shared memory block; use create, from_array or attach
+        to get one."""
+        # pylint: disable=super-init-not-called
+        require_numpy('SharedNumberArray')
+        self._values, self._sigdigs, self._lsd, self._tolerance = _columns(
+            memory, writable)
+        self._memory = memory
+        self._owner = owner
+        self._finalizer = weakref.finalize(self, _release, memory, owner)
+
+    @classmethod
+    def create(
+            cls,
+            shape: Sequence[int],
+            name: Optional[str] = None) -> 'SharedNumberArray':
+        """Allocate a shared array of the given shape, filled like a
+        NumberArray of zeros without metadata."""
+        _require_shared_memory()
+        shape = tuple(int(size) for size in numpy.atleast_1d(shape))
+        if len(shape) > 6:
+            raise ValueError('Shared arrays have at most six dimensions.')
+        size = _OFFSET + 4 * 8 * int(numpy.prod(shape))
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(
+            memory.buf, 0, _MAGIC, _VERSION, len(shape),
+            *(shape + (0,) * (6 - len(shape))))
+        array = cls(memory, owner=True, writable=True)
+        array._values[...] = 0
+        array._sigdigs[...] = numpy.inf
+        array._lsd[...] = -numpy.inf
+        array._tolerance[...] = numpy.nan
+        return array
+
+    @classmethod
+    def from_array(
+            cls,
+            array: NumberArray,
+            name: Optional[str] = None) -> 'SharedNumberArray':
+        """Copy a NumberArray into a new shared array."""
+        shared = cls.create(array.shape, name)
+        shared._values[...] = array.values
+        shared._sigdigs[...] = array.sigdigs
+        shared._lsd[...] = array.lsd
+        shared._tolerance[...] = array.tolerance
+        return shared
+
+    @classmethod
+    def attach(cls, name: str, writable: bool = False) -> 'SharedNumberArray':
+        """Attach to a shared array created by another process."""
+        _require_shared_memory()
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(  # pylint: disable=E1123
+                name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # Only the owner may unlink the block, so stop the resource
+            # tracker from doing it when this process exits.
+            resource_tracker.unregister(
+                memory._name, 'shared_memory')  # pylint: disable=W0212
+        try:
+            return cls(memory, owner=False, writable=writable)
+        except ValueError:
+            memory.close()
+            raise
+
+    def __reduce__(self):
+        return SharedNumberArray.attach, (self.name,)
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if isinstance(item, NumberArray):
+            # Keep the mapping open for as long as the slice is in use.
+            item._shared = self  # pylint: disable=W0201
+        return item
+
+    def __enter__(self) -> 'SharedNumberArray':
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def close(self) -> None:
+        """Detach from the shared memory. Raises BufferError, leaving the
+        array usable, while views of its columns are still alive."""
+        if self._values is None:
+            return
+        writable = self._values.flags.writeable
+        self._values = self._sigdigs = self._lsd = self._tolerance = None
+        try:
+            self._memory.close()
+        except BufferError:
+            # SharedMemory releases its buffer before it fails to unmap, so
+            # take a new one over the mapping the views keep alive.
+            self._memory._buf = memoryview(  # pylint: disable=W0212
+                self._memory._mmap)  # pylint: disable=W0212
+            self._values, self._sigdigs, self._lsd, self._tolerance = \
+                _columns(self._memory, writable)
+            raise BufferError(
+                'Views of the shared array must be released before it is '
+                'closed.') from None
+        self._finalizer.detach()
+
+    def unlink(self) -> None:
+        """Detach from the shared memory and free it. Only the process that
+        created the array may unlink it."""
+        if not self._owner:
+            raise PermissionError(
+                'Only the process that created the array may unlink it.')
+        self.close()
+        _unlink(self._memory)
+
+    @property
+    def name(self) -> str:
+        """Get the name other processes attach with."""
+        return self._memory.name
@@ -34,11 +34,11 @@ setup(
         'Operating System :: POSIX :: Linux',
         'Operating System :: Unix',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9'],
     packages=['pysigdig'],
     include_package_data=False,
-    install_requires=[])
+    python_requires='>=3.7',
+    install_requires=[],
+    extras_require={'numpy': ['numpy']})
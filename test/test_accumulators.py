@@ -0,0 +1,155 @@
+"""Unit test cases for the accumulators module."""
+
+
+import statistics
+import unittest
+import pysigdig
+
+
+NUMBERS = [
+    pysigdig.Number(0.1, lsd=0.1, tolerance=0.05),
+    pysigdig.Number(0.2, lsd=0.01),
+    pysigdig.Number(0.3, sigdigs=1, tolerance=0.05),
+    pysigdig.Number(1250, lsd=10, tolerance=5),
+    pysigdig.Number(-72.35, lsd=0.01, tolerance=0.02),
+    pysigdig.Number(0.001, sigdigs=2),
+    pysigdig.Number(0.7, lsd=0.1)]
+
+
+def components(result):
+    """Get comparable components of an accumulator result."""
+    return result if isinstance(result, int) else result.components
+
+
+class TestAccumulators(unittest.TestCase):
+    """Test the online accumulators."""
+
+    ACCUMULATORS = [
+        pysigdig.CountAccumulator,
+        pysigdig.SumAccumulator,
+        pysigdig.MeanAccumulator,
+        pysigdig.MinAccumulator,
+        pysigdig.MaxAccumulator,
+        pysigdig.VarianceAccumulator]
+
+    def test_merge_matches_single_pass(self) -> None:
+        """Merging shards in any order gives the result of a single pass."""
+        for cls in self.ACCUMULATORS:
+            single = cls()
+            single.update_batch(NUMBERS)
+            shards = [cls(), cls(), cls()]
+            for i, number in enumerate(NUMBERS):
+                shards[i % 3].update(number)
+            merged = cls()
+            for shard in reversed(shards):
+                merged.merge(shard)
+            self.assertEqual(
+                components(merged.result()), components(single.result()))
+
+    def test_serialization(self) -> None:
+        """Accumulators survive a round trip through bytes."""
+        for cls in self.ACCUMULATORS:
+            accumulator = cls()
+            accumulator.update_batch(NUMBERS)
+            restored = pysigdig.Accumulator.from_bytes(
+                accumulator.to_bytes())
+            self.assertIs(type(restored), cls)
+            self.assertEqual(
+                components(restored.result()),
+                components(accumulator.result()))
+
+    def test_sum(self) -> None:
+        """The sum follows the rules of repeated addition."""
+        accumulator = pysigdig.SumAccumulator()
+        accumulator.update_batch(NUMBERS)
+        expected = NUMBERS[0]
+        for number in NUMBERS[1:]:
+            expected = expected + number
+        result = accumulator.result()
+        self.assertAlmostEqual(result.value, expected.value)
+        self.assertEqual(result.sigdigs, expected.sigdigs)
+        self.assertEqual(result.lsd, expected.lsd)
+        self.assertAlmostEqual(result.tolerance, expected.tolerance)
+
+    def test_integer_sum(self) -> None:
+        """Sums of integers stay integers."""
+        accumulator = pysigdig.SumAccumulator()
+        accumulator.update_batch([pysigdig.Number(3600), pysigdig.Number(7)])
+        self.assertEqual(
+            accumulator.result().components,
+            (pysigdig.Number(3600) + pysigdig.Number(7)).components)
+
+    def test_large_integer_sum(self) -> None:
+        """Integer sums stay exact beyond the range of a double."""
+        numbers = [
+            pysigdig.Number(2 ** 53 + 1), pysigdig.Number(2),
+            pysigdig.Number(2 ** 60 + 3)]
+        shards = [pysigdig.SumAccumulator(), pysigdig.SumAccumulator()]
+        shards[0].update_batch(numbers[:2])
+        shards[1].update(numbers[2])
+        shards[1].merge(shards[0])
+        self.assertEqual(
+            shards[1].result().components,
+            (numbers[0] + numbers[1] + numbers[2]).components)
+
+    def test_mixed_sum(self) -> None:
+        """Sums of large ints and floats are rounded once."""
+        accumulator = pysigdig.SumAccumulator()
+        accumulator.update_batch([
+            pysigdig.Number(2 ** 53 + 1), pysigdig.Number(0.5)])
+        self.assertEqual(accumulator.result().components[0], 2.0 ** 53 + 2)
+
+    def test_merge_self(self) -> None:
+        """An accumulator merged into itself doubles its state."""
+        accumulator = pysigdig.SumAccumulator()
+        accumulator.update_batch([
+            pysigdig.Number(0.1), pysigdig.Number(1e20),
+            pysigdig.Number(-1e20), pysigdig.Number(0.3)])
+        accumulator.merge(accumulator)
+        self.assertEqual(accumulator.result().components[0], 0.8)
+
+    def test_mean(self) -> None:
+        """The mean is the sum divided by the count."""
+        accumulator = pysigdig.MeanAccumulator()
+        accumulator.update_batch(NUMBERS[:2])
+        expected = (NUMBERS[0] + NUMBERS[1]) / 2
+        self.assertEqual(accumulator.result().components, expected.components)
+
+    def test_extrema(self) -> None:
+        """Minimum and maximum keep the extreme Number unchanged."""
+        minimum = pysigdig.MinAccumulator()
+        maximum = pysigdig.MaxAccumulator()
+        minimum.update_batch(NUMBERS)
+        maximum.update_batch(NUMBERS)
+        self.assertEqual(
+            minimum.result().components, NUMBERS[4].components)
+        self.assertEqual(
+            maximum.result().components, NUMBERS[3].components)
+
+    def test_variance(self) -> None:
+        """The variance value matches the sample variance."""
+        accumulator = pysigdig.VarianceAccumulator()
+        accumulator.update_batch(NUMBERS)
+        result = accumulator.result()
+        self.assertAlmostEqual(
+            result.components[0],
+            statistics.variance([n.components[0] for n in NUMBERS]))
+        self.assertEqual(result.sigdigs, 1)
+        self.assertGreater(result.tolerance, 0)
+
+    def test_errors(self) -> None:
+        """Test empty accumulators and merging mismatched types."""
+        with self.assertRaises(ValueError):
+            pysigdig.SumAccumulator().result()
+        with self.assertRaises(ValueError):
+            pysigdig.MinAccumulator().result()
+        with self.assertRaises(ValueError):
+            pysigdig.VarianceAccumulator().result()
+        with self.assertRaises(TypeError):
+            pysigdig.SumAccumulator().merge(pysigdig.MeanAccumulator())
+        with self.assertRaises(TypeError):
+            pysigdig.Accumulator()  # pylint: disable=E0110
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Unit test cases for the column module."""
+
+
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+import pysigdig
+
+
+NUMBERS = [
+    pysigdig.Number('12.30', tolerance=0.1),
+    pysigdig.Number(4.5, lsd=0.1),
+    pysigdig.Number(3600, tolerance=10),
+    pysigdig.Number(0.0123, sigdigs=2, tolerance=0.001),
+    pysigdig.Number('98.87') * -1,
+    pysigdig.Number(7.25)]
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumberColumn(unittest.TestCase):
+    """Test the encodings and arithmetic of NumberColumns."""
+
+    def assert_numbers_equal(self, first, second) -> None:
+        """Assert that two sequences hold the same Numbers."""
+        self.assertEqual(len(first), len(second))
+        for left, right in zip(first, second):
+            for a, b in zip(left.components, right.components):
+                if a is None or b is None:
+                    self.assertIs(a, b)
+                else:
+                    self.assertAlmostEqual(a, b, delta=abs(a) * 1e-12)
+
+    def test_uniform(self) -> None:
+        """Scalar metadata is stored once for the whole column."""
+        column = pysigdig.NumberColumn(
+            numpy.linspace(1, 100, 1000), lsd=0.01, tolerance=0.005)
+        self.assertEqual(column.encodings, {
+            'sigdigs': 'derived', 'lsd': 'uniform', 'tolerance': 'uniform'})
+        self.assertLess(column.nbytes, 1000 * 8 + 100)
+        self.assert_numbers_equal(
+            [column[0]], [pysigdig.Number(1.0, lsd=0.01, tolerance=0.005)])
+
+    def test_runs(self) -> None:
+        """Metadata that changes rarely is stored as runs."""
+        column = pysigdig.NumberColumn(
+            numpy.ones(100), sigdigs=numpy.repeat([2, 3, 2], [40, 40, 20]))
+        self.assertEqual(column.encodings['sigdigs'], 'runs')
+        self.assertEqual(column[39].sigdigs, 2)
+        self.assertEqual(column[40].sigdigs, 3)
+        self.assertEqual(column[-1].sigdigs, 2)
+        part = column[30:50]
+        self.assertEqual(part.encodings['sigdigs'], 'runs')
+        numpy.testing.assert_array_equal(
+            part.sigdigs, numpy.repeat([2, 3], [10, 10]))
+
+    def test_dense(self) -> None:
+        """Metadata that diverges is stored per element."""
+        column = pysigdig.NumberColumn(
+            numpy.ones(8), sigdigs=[1, 2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(column.encodings['sigdigs'], 'dense')
+
+    def test_integers(self) -> None:
+        """Integer columns behave like integer Numbers."""
+        values = [1200, 7, 0, -305000]
+        column = pysigdig.NumberColumn(numpy.array(values))
+        self.assert_numbers_equal(
+            column.to_numbers(), [pysigdig.Number(value) for value in values])
+
+    def test_from_numbers(self) -> None:
+        """Columns hold the same Numbers they were created from."""
+        column = pysigdig.NumberColumn.from_numbers(NUMBERS)
+        self.assert_numbers_equal(column.to_numbers(), NUMBERS)
+        self.assert_numbers_equal(list(column[2:]), NUMBERS[2:])
+
+    def test_arithmetic(self) -> None:
+        """Arithmetic follows the rules of Number element by element."""
+        first = pysigdig.NumberColumn.from_numbers(NUMBERS)
+        second = pysigdig.NumberColumn.from_numbers(NUMBERS[::-1])
+        pairs = list(zip(NUMBERS, NUMBERS[::-1]))
+        self.assert_numbers_equal(
+            (first + second).to_numbers(), [a + b for a, b in pairs])
+        self.assert_numbers_equal(
+            (first - second).to_numbers(), [a - b for a, b in pairs])
+        self.assert_numbers_equal(
+            (first * second).to_numbers(), [a * b for a, b in pairs])
+        self.assert_numbers_equal(
+            (first / second).to_numbers(), [a / b for a, b in pairs])
+        self.assert_numbers_equal(
+            ((first + second) * first).to_numbers(),
+            [(a + b) * a for a, b in pairs])
+
+    def test_scalars(self) -> None:
+        """Numbers and floats are broadcast over the column."""
+        column = pysigdig.NumberColumn.from_numbers(NUMBERS)
+        number = pysigdig.Number('2.50', tolerance=0.01)
+        self.assert_numbers_equal(
+            (column + number).to_numbers(), [a + number for a in NUMBERS])
+        self.assert_numbers_equal(
+            (column / number).to_numbers(), [a / number for a in NUMBERS])
+        self.assert_numbers_equal(
+            (column * -3).to_numbers(), [a * -3 for a in NUMBERS])
+        self.assert_numbers_equal(
+            (column - 0.5).to_numbers(), [a - 0.5 for a in NUMBERS])
+
+    def test_compressed_arithmetic(self) -> None:
+        """Arithmetic keeps metadata compressed where the rules allow."""
+        values = numpy.linspace(1, 100, 1000)
+        first = pysigdig.NumberColumn(values, lsd=0.01, tolerance=0.005)
+        second = pysigdig.NumberColumn(
+            values, lsd=numpy.repeat([0.1, 0.001], 500), tolerance=0.01)
+        self.assertEqual((first + first).encodings, first.encodings)
+        total = first - second
+        self.assertEqual(total.encodings, {
+            'sigdigs': 'derived', 'lsd': 'runs', 'tolerance': 'uniform'})
+        numpy.testing.assert_array_equal(
+            total.lsd, numpy.repeat([0.1, 0.01], 500))
+        numpy.testing.assert_array_equal(total.tolerance, 0.015)
+        scaled = pysigdig.NumberColumn(values, sigdigs=3) * \
+            pysigdig.NumberColumn(values, sigdigs=4)
+        self.assertEqual(scaled.encodings, {
+            'sigdigs': 'uniform', 'lsd': 'derived', 'tolerance': 'uniform'})
+
+    def test_errors(self) -> None:
+        """Operands must be Numbers, numbers or columns of the same length."""
+        column = pysigdig.NumberColumn([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            _ = column + pysigdig.NumberColumn([1.0])
+        with self.assertRaises(TypeError):
+            _ = column * 'a'
+        with self.assertRaises(ValueError):
+            pysigdig.NumberColumn([[1.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
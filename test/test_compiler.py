@@ -0,0 +1,99 @@
+"""Unit test cases for the compiler module."""
+
+
+import itertools
+import unittest
+import pysigdig
+
+
+NUMBERS = [
+    pysigdig.Number('12.30', tolerance=0.1),
+    pysigdig.Number('0.05'),
+    pysigdig.Number(3600, tolerance=10),
+    pysigdig.Number(2, tolerance=0.5),
+    pysigdig.Number('98.87') * -1,
+    pysigdig.Number(7)]
+
+
+class TestCompile(unittest.TestCase):
+    """Test compiling formulas into kernels."""
+
+    def assert_matches_operators(self, expression: str) -> None:
+        """Check the compiled formula against evaluation operator by operator
+        for every combination of the sample numbers."""
+        formula = pysigdig.compile(expression)
+        for numbers in itertools.product(
+                NUMBERS, repeat=len(formula.variables)):
+            expected = eval(  # pylint: disable=eval-used
+                expression, {}, dict(zip(formula.variables, numbers)))
+            self.assertEqual(
+                formula(*numbers).components, expected.components)
+
+    def test_example(self) -> None:
+        """Test the mixed formula from the documentation."""
+        self.assert_matches_operators('(a*b - c) / d ** 2')
+
+    def test_addition_and_subtraction(self) -> None:
+        """Test formulas using the least significant digit rule."""
+        self.assert_matches_operators('a + b - c')
+        self.assert_matches_operators('a - 5.333333333')
+
+    def test_multiplication_and_division(self) -> None:
+        """Test formulas using the significant digit rule."""
+        self.assert_matches_operators('a * b / c')
+        self.assert_matches_operators('a * 2.5 / 4')
+
+    def test_floor_division_and_modulo(self) -> None:
+        """Test floor division and modulo by Numbers and constants."""
+        self.assert_matches_operators('a // b + a % b')
+        self.assert_matches_operators('a // 3 - a % 3')
+
+    def test_unary(self) -> None:
+        """Test negation and unary plus."""
+        self.assert_matches_operators('-(a * b) + +c')
+
+    def test_variable_order(self) -> None:
+        """Variables default to the order of first appearance."""
+        formula = pysigdig.compile('(a*b - c) / d ** 2')
+        self.assertEqual(formula.variables, ('a', 'b', 'c', 'd'))
+        formula = pysigdig.compile('(alpha +\nb) * (c\n- alpha)')
+        self.assertEqual(formula.variables, ('alpha', 'b', 'c'))
+        formula = pysigdig.compile('a * b', variables=['b', 'a'])
+        self.assertEqual(formula.variables, ('b', 'a'))
+
+    def test_keyword_arguments(self) -> None:
+        """Variables can be passed by name."""
+        formula = pysigdig.compile('a - b')
+        self.assertEqual(
+            formula(b=NUMBERS[0], a=NUMBERS[2]).components,
+            (NUMBERS[2] - NUMBERS[0]).components)
+        with self.assertRaises(TypeError):
+            formula(NUMBERS[0])
+
+    def test_columns(self) -> None:
+        """Columns are evaluated row by row and Numbers are broadcast."""
+        formula = pysigdig.compile('a * b + c')
+        result = formula(NUMBERS[:3], NUMBERS[3], NUMBERS[3:])
+        self.assertEqual(len(result), 3)
+        for a, c, number in zip(NUMBERS[:3], NUMBERS[3:], result):
+            self.assertEqual(
+                number.components, (a * NUMBERS[3] + c).components)
+        with self.assertRaises(ValueError):
+            formula(NUMBERS[:3], NUMBERS[3], NUMBERS[:2])
+
+    def test_invalid(self) -> None:
+        """Test formulas that cannot be compiled."""
+        with self.assertRaises(ValueError):
+            pysigdig.compile('a + b', variables=['a'])
+        with self.assertRaises(ValueError):
+            pysigdig.compile('a < b')
+        with self.assertRaises(TypeError):
+            pysigdig.compile('a ** b')
+        with self.assertRaises(TypeError):
+            pysigdig.compile('2 * a')
+        with self.assertRaises(TypeError):
+            pysigdig.compile('a')(1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
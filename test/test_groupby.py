@@ -0,0 +1,163 @@
+"""Unit test cases for the groupby module."""
+
+
+import math
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+import pysigdig
+
+
+KEYS = ['a', 'b', 'a', 'c', 'a', 'b', 'c', 'a']
+NUMBERS = [
+    pysigdig.Number(4.25, lsd=0.01, tolerance=0.02),
+    pysigdig.Number(250, tolerance=5),
+    pysigdig.Number(18.5, lsd=0.1, tolerance=0.1),
+    pysigdig.Number(0.75, sigdigs=2),
+    pysigdig.Number(-6.125, lsd=0.001),
+    pysigdig.Number(1200, tolerance=50),
+    pysigdig.Number(0.5, sigdigs=1, tolerance=0.05),
+    pysigdig.Number(4.25, lsd=0.01)]
+
+
+class TestKeyedAggregator(unittest.TestCase):
+    """Test aggregation of keyed Numbers."""
+
+    def setUp(self) -> None:
+        self.aggregator = pysigdig.KeyedAggregator()
+        self.aggregator.update_batch(KEYS, NUMBERS)
+
+    def test_keys(self) -> None:
+        """Keys are kept in order of first appearance."""
+        self.assertEqual(list(self.aggregator.keys()), ['a', 'b', 'c'])
+        self.assertEqual(len(self.aggregator), 3)
+        self.assertIn('c', self.aggregator)
+        self.assertEqual(self.aggregator.count('a'), 4)
+
+    def test_sum_and_mean(self) -> None:
+        """Sums and means match repeated addition and division."""
+        expected = NUMBERS[0] + NUMBERS[2] + NUMBERS[4] + NUMBERS[7]
+        self.assertEqual(
+            self.aggregator.sum('a').components, expected.components)
+        self.assertEqual(
+            self.aggregator.mean('a').components, (expected / 4).components)
+        expected = NUMBERS[1] + NUMBERS[5]
+        self.assertEqual(
+            self.aggregator.sum('b').components, expected.components)
+
+    def test_extrema(self) -> None:
+        """Minimum and maximum keep the extreme Number of each key."""
+        self.assertEqual(
+            self.aggregator.min('a').components, NUMBERS[4].components)
+        self.assertEqual(
+            self.aggregator.max('a').components, NUMBERS[2].components)
+        self.assertEqual(
+            self.aggregator.min('c').components, NUMBERS[6].components)
+        self.assertEqual(
+            self.aggregator.max('b').components, NUMBERS[5].components)
+
+    def test_large_integers(self) -> None:
+        """Integer sums and extrema stay exact beyond the range of a double."""
+        numbers = [
+            pysigdig.Number(2 ** 53 + 1), pysigdig.Number(2),
+            pysigdig.Number(2 ** 60 + 3)]
+        aggregator = pysigdig.KeyedAggregator()
+        aggregator.update_batch('kkk', numbers)
+        self.assertEqual(
+            aggregator.sum('k').components,
+            (numbers[0] + numbers[1] + numbers[2]).components)
+        self.assertEqual(aggregator.max('k').components[0], 2 ** 60 + 3)
+        aggregator.update_batch('jjj', [
+            pysigdig.Number(2 ** 53), pysigdig.Number(1),
+            pysigdig.Number(-2)])
+        self.assertEqual(aggregator.sum('j').components[0], 2 ** 53 - 1)
+        aggregator.update('k', pysigdig.Number(0.5))
+        self.assertEqual(
+            aggregator.sum('k').components,
+            (numbers[0] + numbers[1] + numbers[2] +
+             pysigdig.Number(0.5)).components)
+
+    def assert_same_aggregates(self, first, second) -> None:
+        """Assert that two aggregators hold the same results."""
+        self.assertEqual(list(first.keys()), list(second.keys()))
+        for key in first.keys():
+            for name, number in first.result(key).items():
+                self.assertEqual(
+                    number.components, second.result(key)[name].components)
+
+    def test_update_columns(self) -> None:
+        """Columns of readings give the same results as Numbers."""
+        keys = ['x', 'y', 'x', 'x', 'y']
+        values = [1.25, 30.0, -0.5, 12, 7.125]
+        tolerances = [0.01, float('nan'), 0.02, 0.5, 0.01]
+        columns = pysigdig.KeyedAggregator()
+        columns.update_columns(keys, values, lsd=0.01, tolerance=tolerances)
+        numbers = pysigdig.KeyedAggregator()
+        numbers.update_batch(keys, [
+            pysigdig.Number(
+                value, lsd=0.01, tolerance=None if math.isnan(tol) else tol)
+            for value, tol in zip(values, tolerances)])
+        self.assert_same_aggregates(columns, numbers)
+        columns = pysigdig.KeyedAggregator()
+        columns.update_columns(keys, values, sigdigs=[3, 2, 1, 4, 2])
+        numbers = pysigdig.KeyedAggregator()
+        numbers.update_batch(keys, [
+            pysigdig.Number(value, sigdigs=count)
+            for value, count in zip(values, [3, 2, 1, 4, 2])])
+        self.assert_same_aggregates(columns, numbers)
+        with self.assertRaises(ValueError):
+            columns.update_columns(keys, values[:2])
+        with self.assertRaises(ValueError):
+            columns.update_columns(keys, values, sigdigs=[1, 2])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_update_columns_from_numpy(self) -> None:
+        """Numpy columns are read like sequences."""
+        keys = numpy.array([3, 1, 3, 2, 1])
+        values = numpy.array([1.25, 30.0, -0.5, 12.0, 7.125])
+        sigdigs = numpy.array([3, 2, 1, 4, 2])
+        numbers = pysigdig.KeyedAggregator()
+        numbers.update_batch(keys.tolist(), [
+            pysigdig.Number(value, sigdigs=count, tolerance=0.01)
+            for value, count in zip(values.tolist(), sigdigs.tolist())])
+        columns = pysigdig.KeyedAggregator()
+        columns.update_columns(keys, values, sigdigs=sigdigs, tolerance=0.01)
+        self.assert_same_aggregates(columns, numbers)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_update_columns_from_array(self) -> None:
+        """NumberArrays and NumberColumns are read column by column."""
+        keys = numpy.array([3, 1, 3, 2, 1])
+        array = pysigdig.NumberArray(
+            [1.25, 30.0, -0.5, 12.0, 7.125], sigdigs=[3, 2, 1, 4, 2],
+            tolerance=0.01)
+        numbers = pysigdig.KeyedAggregator()
+        numbers.update_batch(keys.tolist(), array.to_numbers())
+        for values in (array, pysigdig.NumberColumn.from_array(array)):
+            columns = pysigdig.KeyedAggregator()
+            columns.update_columns(keys, values)
+            self.assert_same_aggregates(columns, numbers)
+
+    def test_results(self) -> None:
+        """All aggregates are reported per key."""
+        results = self.aggregator.results()
+        self.assertEqual(set(results), {'a', 'b', 'c'})
+        self.assertEqual(set(results['a']), {'sum', 'mean', 'min', 'max'})
+
+    def test_selected_aggregations(self) -> None:
+        """Only the requested aggregations are kept."""
+        aggregator = pysigdig.KeyedAggregator(['max'])
+        aggregator.update_batch(KEYS, NUMBERS)
+        self.assertEqual(set(aggregator.result('a')), {'max'})
+        with self.assertRaises(ValueError):
+            aggregator.sum('a')
+        with self.assertRaises(ValueError):
+            pysigdig.KeyedAggregator(['median'])
+
+
+if __name__ == '__main__':
+    unittest.main()
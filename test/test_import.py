@@ -0,0 +1,70 @@
+"""Unit test cases for importing the pysigdig package."""
+
+
+from os import path
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import pysigdig
+
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+BUDGET = 0.15  # seconds for a bare import, well below what numpy takes
+
+SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import pysigdig
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'elapsed': elapsed,
+    'modules': [name for name in ('numpy', 'pandas') if name in sys.modules],
+}))
+'''
+
+
+def _import_in_subprocess() -> dict:
+    """Import pysigdig in a fresh interpreter and report on it."""
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        filter(None, [ROOT, environment.get('PYTHONPATH')]))
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT], check=True, cwd=ROOT,
+        env=environment, stdout=subprocess.PIPE).stdout
+    return json.loads(output.decode('utf-8'))
+
+
+class TestImport(unittest.TestCase):
+    """Test that importing pysigdig stays light."""
+
+    def test_no_heavy_modules(self) -> None:
+        """A bare import loads neither numpy nor pandas."""
+        self.assertEqual(_import_in_subprocess()['modules'], [])
+
+    def test_time_budget(self) -> None:
+        """A bare import finishes within the time budget."""
+        elapsed = min(_import_in_subprocess()['elapsed'] for _ in range(3))
+        self.assertLess(elapsed, BUDGET)
+
+    def test_lazy_attributes(self) -> None:
+        """Names are loaded from their submodules on first access."""
+        self.assertIs(pysigdig.KeyedAggregator,
+                      pysigdig.groupby.KeyedAggregator)
+        self.assertIs(pysigdig.compile, pysigdig.compiler.compile)
+        self.assertIn('NumberArray', dir(pysigdig))
+        self.assertIn('linalg', dir(pysigdig))
+        for name in pysigdig.__all__:
+            self.assertTrue(hasattr(pysigdig, name), name)
+
+    def test_unknown_attribute(self) -> None:
+        """Unknown names raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            _ = pysigdig.missing
+
+
+if __name__ == '__main__':
+    unittest.main()
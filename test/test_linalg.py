@@ -0,0 +1,124 @@
+"""Unit test cases for the linalg module."""
+
+
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+import pysigdig
+
+
+random.seed(0)
+
+
+def random_number() -> pysigdig.Number:
+    """Create a Number with random digits and tolerance."""
+    number = pysigdig.Number(
+        str(round(random.uniform(0, 100), random.randint(0, 3))),
+        tolerance=random.choice([None, 0.1]))
+    return number * random.choice([1, -1])
+
+
+def step_by_step(a: list, b: list) -> list:
+    """Multiply nested lists of Numbers one operator at a time."""
+    result = []
+    for row in a:
+        result.append([])
+        for j in range(len(b[0])):
+            total = row[0] * b[0][j]
+            for k in range(1, len(b)):
+                total = total + row[k] * b[k][j]
+            result[-1].append(total)
+    return result
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestMatmul(unittest.TestCase):
+    """Test products of NumberArrays."""
+
+    def assert_close(self, number, expected) -> None:
+        """Check that the Numbers agree up to rounding of the sums."""
+        self.assertAlmostEqual(number.components[0], expected.components[0])
+        self.assertEqual(number.sigdigs, expected.sigdigs)
+        self.assertAlmostEqual(number.lsd, expected.lsd)
+        if expected.tolerance is None:
+            self.assertIsNone(number.tolerance)
+        else:
+            self.assertAlmostEqual(number.tolerance, expected.tolerance)
+
+    def test_matrix_product(self) -> None:
+        """Matrix products follow multiply then add."""
+        a = [[random_number() for _ in range(4)] for _ in range(3)]
+        b = [[random_number() for _ in range(5)] for _ in range(4)]
+        result = pysigdig.matmul(
+            pysigdig.NumberArray.from_numbers(a),
+            pysigdig.NumberArray.from_numbers(b))
+        self.assertEqual(result.shape, (3, 5))
+        for row, expected_row in zip(result.to_numbers(), step_by_step(a, b)):
+            for number, expected in zip(row, expected_row):
+                self.assert_close(number, expected)
+
+    def test_exact_powers(self) -> None:
+        """Products that land on powers of ten and zeros are handled."""
+        a = [[pysigdig.Number(2), pysigdig.Number(0)],
+             [pysigdig.Number('2.5'), pysigdig.Number(4)]]
+        b = [[pysigdig.Number(5), pysigdig.Number('0.40')],
+             [pysigdig.Number(25), pysigdig.Number(3)]]
+        result = pysigdig.matmul(
+            pysigdig.NumberArray.from_numbers(a),
+            pysigdig.NumberArray.from_numbers(b))
+        for row, expected_row in zip(result.to_numbers(), step_by_step(a, b)):
+            for number, expected in zip(row, expected_row):
+                self.assert_close(number, expected)
+
+    def test_vectors(self) -> None:
+        """Vector products reduce dimensions like numpy."""
+        a = [random_number() for _ in range(4)]
+        b = [random_number() for _ in range(4)]
+        matrix = [[random_number() for _ in range(4)] for _ in range(2)]
+        result = pysigdig.dot(
+            pysigdig.NumberArray.from_numbers(a),
+            pysigdig.NumberArray.from_numbers(b))
+        self.assertIsInstance(result, pysigdig.Number)
+        self.assert_close(
+            result, step_by_step([a], [[number] for number in b])[0][0])
+        result = pysigdig.dot(
+            pysigdig.NumberArray.from_numbers(matrix),
+            pysigdig.NumberArray.from_numbers(b))
+        self.assertEqual(result.shape, (2,))
+
+    def test_misaligned(self) -> None:
+        """Shapes must be aligned."""
+        with self.assertRaises(ValueError):
+            pysigdig.matmul(
+                pysigdig.NumberArray([1.0, 2.0]),
+                pysigdig.NumberArray([1.0, 2.0, 3.0]))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestSolve(unittest.TestCase):
+    """Test solving linear systems."""
+
+    def test_solve(self) -> None:
+        """The solution keeps the fewest significant digits."""
+        a = pysigdig.NumberArray(
+            [[2.0, 1.0], [1.0, 3.0]], sigdigs=[[3, 4], [4, 4]],
+            tolerance=0.01)
+        b = pysigdig.NumberArray([3.0, 5.0], sigdigs=5)
+        x = pysigdig.solve(a, b)
+        self.assertEqual(x.shape, (2,))
+        self.assertAlmostEqual(x[0].value, 0.8)
+        self.assertAlmostEqual(x[1].value, 1.4)
+        self.assertEqual(x[0].sigdigs, 3)
+        self.assertGreater(x[0].tolerance, 0)
+        x = pysigdig.solve(pysigdig.NumberArray(
+            [[2.0, 0.0], [0.0, 4.0]]), b)
+        self.assertTrue(numpy.isnan(x.tolerance).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
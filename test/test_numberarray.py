@@ -0,0 +1,69 @@
+"""Unit test cases for the numberarray module."""
+
+
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+import pysigdig
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumberArray(unittest.TestCase):
+    """Test construction and indexing of NumberArrays."""
+
+    def test_sigdigs(self) -> None:
+        """Significant digits determine the least significant digits."""
+        array = pysigdig.NumberArray([1.0002003, 123.456], sigdigs=5)
+        for i, value in enumerate([1.0002003, 123.456]):
+            expected = pysigdig.Number(value, sigdigs=5)
+            self.assertEqual(array[i].components, expected.components)
+
+    def test_lsd(self) -> None:
+        """Least significant digits determine the significant digits."""
+        array = pysigdig.NumberArray(
+            [123.456789, 0.5], lsd=0.001, tolerance=-0.1)
+        expected = pysigdig.Number(123.456789, lsd=0.001, tolerance=0.1)
+        self.assertEqual(array[0].components, expected.components)
+        self.assertEqual(array[1].sigdigs, 3)
+
+    def test_float_defaults(self) -> None:
+        """Without metadata the elements behave like float Numbers."""
+        number = pysigdig.NumberArray([1.2])[0]
+        self.assertEqual(
+            number.components, pysigdig.Number(1.2).components)
+
+    def test_integer_defaults(self) -> None:
+        """Integer arrays behave like integer Numbers."""
+        values = [1200, 7, 0, -305000]
+        array = pysigdig.NumberArray(numpy.array(values))
+        for number, value in zip(array, values):
+            self.assertEqual(
+                number.components, pysigdig.Number(value).components)
+
+    def test_from_numbers(self) -> None:
+        """Numbers round trip through a two dimensional array."""
+        numbers = [
+            [pysigdig.Number('12.30', tolerance=0.1),
+             pysigdig.Number('0.05')],
+            [pysigdig.Number(3600, tolerance=10), pysigdig.Number(7)]]
+        array = pysigdig.NumberArray.from_numbers(numbers)
+        self.assertEqual(array.shape, (2, 2))
+        self.assertEqual(len(array), 2)
+        for row, expected_row in zip(array.to_numbers(), numbers):
+            for number, expected in zip(row, expected_row):
+                self.assertEqual(number, expected)
+        self.assertIsInstance(array[1], pysigdig.NumberArray)
+        self.assertTrue(numpy.isnan(array.tolerance[0, 1]))
+
+    def test_rounded(self) -> None:
+        """Rounded values match float(Number)."""
+        array = pysigdig.NumberArray([45.6949, 1234.5], sigdigs=3)
+        self.assertEqual(array.rounded().tolist(), [45.7, 1230.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Unit test cases for the rounding module."""
+
+
+from array import array
+from decimal import (
+    ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP, ROUND_UP)
+from unittest import mock
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+import pysigdig
+from pysigdig import rounding
+
+
+random.seed(0)
+VALUES = [0.0, -0.0, 2.675, 0.125, 1.5, 2.5, -45.6900, 123456.789, 3600.0] + [
+    random.uniform(-10, 10) * 10 ** random.randint(-8, 8)
+    for _ in range(500)]
+LARGE = [
+    random.uniform(-10, 10) * 10 ** random.randint(24, 39)
+    for _ in range(1000)]
+
+
+class TestRounding(unittest.TestCase):
+    """Test rounding sequences of floats."""
+
+    def test_sigfigs_matches_number(self) -> None:
+        """Rounding to significant digits matches float(Number)."""
+        for sigdigs in (1, 3, 6):
+            result = pysigdig.round_sigfigs(VALUES + LARGE, sigdigs)
+            self.assertIsInstance(result, array)
+            self.assertEqual(list(result), [
+                float(pysigdig.Number(value, sigdigs=sigdigs))
+                for value in VALUES + LARGE])
+
+    def test_lsd_matches_number(self) -> None:
+        """Rounding to a least significant digit matches Number."""
+        for lsd in (100, 0.01, float('-inf')):
+            self.assertEqual(
+                list(pysigdig.round_to_lsd(VALUES, lsd)),
+                [pysigdig.Number.round_to_lsd(value, lsd)
+                 for value in VALUES])
+
+    def test_rounding_modes(self) -> None:
+        """Test rounding modes other than half even."""
+        values = [2.5, -2.5, 0.125, 1.01]
+        self.assertEqual(
+            list(pysigdig.round_to_lsd(values, 1, mode=ROUND_HALF_UP)),
+            [3.0, -3.0, 0.0, 1.0])
+        self.assertEqual(
+            list(pysigdig.round_to_lsd(values, 0.1, mode=ROUND_DOWN)),
+            [2.5, -2.5, 0.1, 1.0])
+        self.assertEqual(
+            list(pysigdig.round_sigfigs(values, 1, mode=ROUND_CEILING)),
+            [3.0, -2.0, 0.2, 2.0])
+        self.assertEqual(
+            list(pysigdig.round_to_lsd([0.1, 1.1, -1.1], 0.1, mode=ROUND_UP)),
+            [0.1, 1.1, -1.1])
+        self.assertEqual(
+            list(pysigdig.round_sigfigs([0.1, 1.1], 1, mode=ROUND_UP)),
+            [0.1, 2.0])
+        self.assertEqual(
+            list(pysigdig.round_to_lsd([0.3, 2.2], 0.1, mode=ROUND_FLOOR)),
+            [0.3, 2.2])
+        self.assertEqual(
+            list(pysigdig.round_to_lsd([2.675], 0.01, mode=ROUND_HALF_UP)),
+            [2.68])
+        with self.assertRaises(ValueError):
+            pysigdig.round_to_lsd(values, 1, mode='ROUND_05UP')
+
+    def test_inplace_array(self) -> None:
+        """Arrays of doubles can be rounded in place."""
+        values = array('d', [1.234, 5.678])
+        self.assertIs(pysigdig.round_to_lsd(values, 0.1, inplace=True), values)
+        self.assertEqual(list(values), [1.2, 5.7])
+        with self.assertRaises(TypeError):
+            pysigdig.round_to_lsd([1.234], 0.1, inplace=True)
+
+    def test_invalid(self) -> None:
+        """Test invalid significant digits and least significant digits."""
+        with self.assertRaises(ValueError):
+            pysigdig.round_sigfigs(VALUES, 0)
+        with self.assertRaises(ValueError):
+            pysigdig.round_to_lsd(VALUES, -0.1)
+
+    def test_without_numpy(self) -> None:
+        """The pure Python fallback gives the same results."""
+        expected = list(pysigdig.round_sigfigs(VALUES, 3))
+        expected_lsd = list(pysigdig.round_to_lsd(
+            VALUES, 0.1, mode=ROUND_HALF_UP))
+        with mock.patch.object(rounding, 'numpy', None):
+            self.assertEqual(
+                list(pysigdig.round_sigfigs(VALUES, 3)), expected)
+            self.assertEqual(
+                list(pysigdig.round_to_lsd(VALUES, 0.1, mode=ROUND_HALF_UP)),
+                expected_lsd)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestRoundingNumpy(unittest.TestCase):
+    """Test rounding numpy arrays."""
+
+    def test_per_value_parameters(self) -> None:
+        """Significant digits and least significant digits can vary."""
+        values = numpy.array([1.2345, 1.2345, 987.65])
+        self.assertEqual(
+            pysigdig.round_sigfigs(values, numpy.array([1, 3, 2])).tolist(),
+            [1.0, 1.23, 990.0])
+        self.assertEqual(
+            pysigdig.round_to_lsd(values, [0.1, 0.001, 10]).tolist(),
+            [1.2, 1.234, 990.0])
+
+    def test_on_grid(self) -> None:
+        """Values on the grid are kept by every mode without a slow path."""
+        values = numpy.round(numpy.linspace(-1000, 1000, 20001), 2)
+        for mode in rounding.ROUNDING_MODES:
+            with mock.patch.object(
+                    rounding, '_round_scalar',
+                    side_effect=AssertionError('slow path')):
+                self.assertEqual(
+                    pysigdig.round_to_lsd(values, 0.01, mode=mode).tolist(),
+                    values.tolist())
+
+    def test_inplace(self) -> None:
+        """Numpy arrays can be rounded in place."""
+        values = numpy.array(VALUES)
+        expected = pysigdig.round_sigfigs(values, 4)
+        self.assertIsInstance(expected, numpy.ndarray)
+        self.assertIs(pysigdig.round_sigfigs(values, 4, inplace=True), values)
+        self.assertEqual(values.tolist(), expected.tolist())
+        with self.assertRaises(TypeError):
+            pysigdig.round_sigfigs(
+                numpy.array([1, 2]), 4, inplace=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit test cases for the shared module."""
+
+
+import gc
+import multiprocessing
+import pickle
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+import pysigdig
+
+
+def _total(array: pysigdig.SharedNumberArray) -> tuple:
+    """Sum a shared array in a worker process."""
+    total = array[0]
+    for number in array[1:]:
+        total += number
+    return total.components
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestSharedNumberArray(unittest.TestCase):
+    """Test creating, attaching to and releasing shared arrays."""
+
+    def setUp(self) -> None:
+        self.array = pysigdig.NumberArray(
+            [[1.25, 30.0, 0.004], [2.5, 4.0, 600.0]],
+            sigdigs=[[3, 2, 1], [2, 1, 4]],
+            tolerance=0.01)
+
+    def test_create(self) -> None:
+        """New shared arrays hold zeros without metadata."""
+        with pysigdig.SharedNumberArray.create((2, 3)) as shared:
+            self.assertEqual(shared.shape, (2, 3))
+            self.assertEqual(
+                shared[1, 2].components, pysigdig.Number(0.0).components)
+
+    def test_from_array(self) -> None:
+        """Copies keep every Number of the array."""
+        with pysigdig.SharedNumberArray.from_array(self.array) as shared:
+            for column in ('values', 'sigdigs', 'lsd', 'tolerance'):
+                numpy.testing.assert_array_equal(
+                    getattr(shared, column), getattr(self.array, column))
+
+    def test_attach(self) -> None:
+        """Attached arrays read the memory of the creator without copying."""
+        with pysigdig.SharedNumberArray.from_array(self.array) as shared:
+            with pysigdig.SharedNumberArray.attach(shared.name) as view:
+                self.assertEqual(view.shape, (2, 3))
+                self.assertEqual(
+                    view[0, 1].components, self.array[0, 1].components)
+                self.assertFalse(view.values.flags.writeable)
+                shared.values[0, 1] = 31.0
+                self.assertEqual(float(view[0, 1]), 31.0)
+                with self.assertRaises(PermissionError):
+                    view.unlink()
+
+    def test_pickle(self) -> None:
+        """Pickling sends the name and unpickling attaches."""
+        with pysigdig.SharedNumberArray.from_array(self.array) as shared:
+            with pickle.loads(pickle.dumps(shared)) as view:
+                self.assertEqual(view.name, shared.name)
+                self.assertEqual(
+                    view[1, 2].components, self.array[1, 2].components)
+
+    def test_unlink(self) -> None:
+        """Unlinked arrays can no longer be attached to."""
+        shared = pysigdig.SharedNumberArray.create(4)
+        name = shared.name
+        shared.unlink()
+        with self.assertRaises(FileNotFoundError):
+            pysigdig.SharedNumberArray.attach(name)
+
+    def test_garbage_collection(self) -> None:
+        """The creator frees the memory when its array is collected."""
+        shared = pysigdig.SharedNumberArray.create(4)
+        name = shared.name
+        del shared
+        with self.assertRaises(FileNotFoundError):
+            pysigdig.SharedNumberArray.attach(name)
+
+    def test_slice_lifetime(self) -> None:
+        """Slices keep the array they were taken from attached."""
+        with pysigdig.SharedNumberArray.from_array(self.array) as shared:
+            row = pysigdig.SharedNumberArray.attach(shared.name)[1]
+            gc.collect()
+            numpy.testing.assert_array_equal(
+                row.values,  # pylint: disable=E1101
+                self.array[1].values)  # pylint: disable=E1101
+            del row
+
+    def test_view_after_unlink(self) -> None:
+        """Arrays are not closed under views of their columns."""
+        shared = pysigdig.SharedNumberArray.from_array(self.array)
+        values = shared.values
+        with self.assertRaises(BufferError):
+            shared.unlink()
+        numpy.testing.assert_array_equal(values[0], self.array.values[0])
+        self.assertEqual(float(shared[1, 2]), 600.0)
+        del values
+        shared.unlink()
+
+    def test_workers(self) -> None:
+        """Worker processes attach by name and see the same Numbers."""
+        with pysigdig.SharedNumberArray.from_array(self.array[0]) as shared:
+            with multiprocessing.Pool(2) as pool:
+                results = pool.map(_total, [shared] * 4)
+            expected = _total(shared)
+            self.assertEqual(results, [expected] * 4)
+            self.assertEqual(float(shared[2]), 0.004)
+
+
+if __name__ == '__main__':
+    unittest.main()